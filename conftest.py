@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures for test_reconciliation.py.
+
+Provide the same loaded system and generated suggestions that run_all_tests
+passes to the tests that share them.
+"""
+
+import pytest
+
+from reconciliation_system import ReconciliationSystem
+
+
+@pytest.fixture(scope="session")
+def system(tmp_path_factory):
+    """System loaded from the sample CSVs, with a fresh (empty) state file."""
+    state_file = tmp_path_factory.mktemp("state") / "reconciliation_state.json"
+    system = ReconciliationSystem(state_file=str(state_file))
+    system.load_data()
+    return system
+
+
+@pytest.fixture(scope="session")
+def suggestions(system):
+    """Suggestions generated once for the session (a tuple snapshot)."""
+    return tuple(system.generate_suggestions())
@@ -15,18 +15,108 @@ Features:
 import csv
 import json
 import os
+import pickle
+import re
 import inspect
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Tuple, Dict, Callable
+from typing import List, Optional, Set, Tuple, Dict, Callable
 from difflib import SequenceMatcher
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import islice
 from decimal import Decimal, ROUND_HALF_UP
 from enum import Enum
 
 
+# Patterns used by _extract_potential_surnames to clean text before splitting
+_U3A_RE = re.compile(r'\bu3a\d*\b', re.IGNORECASE)
+_SUBS_RE = re.compile(r'\bsubs?\b', re.IGNORECASE)
+_REFUND_RE = re.compile(r'\brefunds?\b', re.IGNORECASE)
+_NUM_RE = re.compile(r'\b\d+(/\d+)?\b')
+_DASH_RE = re.compile(r'[-]')
+_APOS_RE = re.compile(r"'")
+_WORD_RE = re.compile(r'^[A-Za-z]+$')
+_DIGITS_RE = re.compile(r'(\d+)')
+
+# Member number in a beacon detail field, e.g. "member_1: 1234"
+_MEM_NO_RE = re.compile(r'member_1[:\s]+(\d+)', re.IGNORECASE)
+
+# Write buffer size for CSV exports (fewer, larger writes for big exports)
+_CSV_BUFFER_SIZE = 1 << 20
+# Rows passed to each writer.writerows() call when a row count is needed
+_CSV_BATCH_SIZE = 1024
+
+# State files with this suffix are pickled instead of written as JSON
+_PICKLE_STATE_SUFFIX = '.pkl'
+
+# Noise words that should not be considered as names
+_NOISE_WORDS = frozenset({
+    'PAYMENT', 'TRANSFER', 'CREDIT', 'DEBIT', 'REF', 'FT', 'TFR',
+    'MISS', 'MR', 'MRS', 'MS', 'DR', 'PROF',
+    'THE', 'AND', 'FOR', 'WITH'
+})
+
+# Set to True (or RECONCILE_DEBUG=1 in the environment) to print debug messages
+DEBUG = os.environ.get('RECONCILE_DEBUG', '') not in ('', '0')
+
+
+def _batched(iterable, size: int):
+    """Yield lists of up to size items from iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _to_pence(amount: Decimal) -> int:
+    """Convert a pounds amount to whole pence for integer matching arithmetic.
+
+    CSV amounts are checked by _parse_amount, so rounding only affects
+    amounts from elsewhere (e.g. a hand-edited state file).
+    """
+    return int(amount.scaleb(2).to_integral_value(ROUND_HALF_UP))
+
+
+def _parse_amount(text: str) -> Decimal:
+    """Parse a CSV amount, rejecting fractions of a penny.
+
+    Matching compares whole pence, so an amount such as 10.004 would
+    otherwise be rounded and match 10.00 exactly. Infinite, NaN and
+    out-of-range amounts are rejected too; all raise ValueError, which the
+    loaders report and skip.
+    """
+    amount = Decimal(text.strip().replace(',', ''))
+    if not amount.is_finite():
+        raise ValueError(f"amount {amount} is not a finite number")
+    try:
+        pence = amount.scaleb(2)
+        whole = pence == pence.to_integral_value()
+    except ArithmeticError as e:
+        raise ValueError(f"amount {amount} is out of range") from e
+    if not whole:
+        raise ValueError(f"amount {amount} is not a whole number of pence")
+    return amount
+
+
+def _trans_no_numbers(trans_no) -> Tuple[Optional[int], Optional[int]]:
+    """Parse a trans_no for range checks.
+
+    Returns (integer value, first run of digits), each None if unavailable.
+    """
+    try:
+        value = int(trans_no)
+    except (ValueError, TypeError):
+        value = None
+    digits = _DIGITS_RE.search(str(trans_no))
+    return value, (int(digits.group(1)) if digits else None)
+
+
 def debug_log(message: str):
-    """Print debug message with line number."""
+    """Print debug message with line number (only when DEBUG is enabled)."""
+    if not DEBUG:
+        return
     frame = inspect.currentframe().f_back
     print(f"[DEBUG L{frame.f_lineno}] {message}")
 
@@ -41,7 +131,16 @@ class MatchStatus(Enum):
     MANUALLY_RESOLVED = "manually_resolved"
 
 
-@dataclass
+# Bank transaction status labels used by get_all_bank_transactions_with_status
+# (any other status on a matched transaction is reported as 'matched')
+_BANK_STATUS_LABELS = {
+    MatchStatus.CONFIRMED: 'matched',
+    MatchStatus.MANUAL_MATCH: 'manual_match',
+    MatchStatus.MANUALLY_RESOLVED: 'resolved',
+}
+
+
+@dataclass(slots=True)
 class BankTransaction:
     """Represents a bank transaction."""
     id: str
@@ -50,6 +149,21 @@ class BankTransaction:
     description: str
     amount: Decimal
     raw_data: Dict = field(default_factory=dict)
+    # Amount in whole pence and date as a day ordinal, used by the matching arithmetic
+    amount_pence: int = field(default=0, init=False, repr=False, compare=False)
+    date_ord: int = field(default=0, init=False, repr=False, compare=False)
+    # Cached formatted_date() result
+    _fmt_date: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.amount_pence = _to_pence(self.amount)
+        self.date_ord = self.date.toordinal()
+
+    def formatted_date(self) -> str:
+        """Date as DD/MM/YYYY for CSV exports (formatted once, then cached)."""
+        if self._fmt_date is None:
+            self._fmt_date = self.date.strftime('%d/%m/%Y')
+        return self._fmt_date
 
     def to_dict(self) -> Dict:
         return {
@@ -72,7 +186,7 @@ class BankTransaction:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BeaconEntry:
     """Represents a Beacon accounting entry."""
     id: str
@@ -83,11 +197,26 @@ class BeaconEntry:
     detail: str
     raw_data: Dict = field(default_factory=dict)
     matched: bool = False
+    # Amount in whole pence and date as a day ordinal, used by the matching arithmetic
+    amount_pence: int = field(default=0, init=False, repr=False, compare=False)
+    date_ord: int = field(default=0, init=False, repr=False, compare=False)
+    # Cached formatted_date() result
+    _fmt_date: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.amount_pence = _to_pence(self.amount)
+        self.date_ord = self.date.toordinal()
+
+    def formatted_date(self) -> str:
+        """Date as DD/MM/YYYY for state files and CSV exports (formatted once, then cached)."""
+        if self._fmt_date is None:
+            self._fmt_date = self.date.strftime('%d/%m/%Y')
+        return self._fmt_date
 
     def to_dict(self) -> Dict:
         return {
             'id': self.id,
-            'date': self.date.strftime('%d/%m/%Y'),
+            'date': self.formatted_date(),
             'trans_no': self.trans_no,
             'payee': self.payee,
             'amount': str(self.amount),
@@ -109,7 +238,7 @@ class BeaconEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchSuggestion:
     """Represents a suggested match between bank and beacon transactions."""
     id: str
@@ -122,6 +251,15 @@ class MatchSuggestion:
     date_score: float = 0.0
     name_score: float = 0.0
     comment: str = ""  # Optional comment for manually resolved items
+    # Cached sum of beacon entry amounts (see beacon_total; not serialized)
+    _beacon_total: Optional[Decimal] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def beacon_total(self) -> Decimal:
+        """Sum of beacon entry amounts, computed on first use."""
+        if self._beacon_total is None:
+            self._beacon_total = sum((e.amount for e in self.beacon_entries), Decimal('0'))
+        return self._beacon_total
 
     def to_dict(self) -> Dict:
         return {
@@ -157,7 +295,7 @@ class ReconciliationSystem:
     """Main reconciliation system for matching bank and beacon transactions."""
 
     # Common amounts that are weak matching signals
-    COMMON_AMOUNTS = [Decimal('13.00'), Decimal('9.50'), Decimal('6.50')]
+    COMMON_AMOUNTS = frozenset({Decimal('13.00'), Decimal('9.50'), Decimal('6.50')})
 
     # Auto-confirm thresholds
     AUTO_CONFIRM_COMMON_THRESHOLD = 0.90  # >90% for common amounts
@@ -171,7 +309,8 @@ class ReconciliationSystem:
                  beacon_file: str = "Beacon_Entries.csv",
                  state_file: str = "reconciliation_state.json",
                  member_lookup_file: str = "member_lookup.csv",
-                 base_dir: str = None):
+                 base_dir: str = None,
+                 preloaded: Optional[Tuple[List[BankTransaction], List[BeaconEntry]]] = None):
         # Use script directory as base if not specified
         if base_dir is None:
             base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -183,6 +322,10 @@ class ReconciliationSystem:
         self.state_file = os.path.join(base_dir, state_file) if not os.path.isabs(state_file) else state_file
         self.member_lookup_file = os.path.join(base_dir, member_lookup_file) if not os.path.isabs(member_lookup_file) else member_lookup_file
 
+        # Already-parsed (bank_transactions, beacon_entries) to use instead of
+        # reading the CSV files in load_data
+        self.preloaded = preloaded
+
         self.bank_transactions: List[BankTransaction] = []
         self.beacon_entries: List[BeaconEntry] = []
         self.match_suggestions: List[MatchSuggestion] = []
@@ -192,14 +335,35 @@ class ReconciliationSystem:
         # Member lookup dictionary: mem_no -> {status, forename, surname}
         self.member_lookup: Dict[str, Dict] = {}
 
-        # Track which beacon entries are already matched
-        self.matched_beacon_ids: set = set()
+        # Track which beacon entries are already matched (always a set, for O(1)
+        # membership tests in the matching and export paths)
+        self.matched_beacon_ids: Set[str] = set()
         # Track which bank transactions have been rejected (to restore status on reload)
         self.rejected_bank_ids: set = set()
+        # Cache of bank_id -> confirmed/manual/resolved match, rebuilt on demand
+        # by _get_matched_bank_index and reset whenever confirmed_matches changes
+        self._matched_bank_index: Optional[Dict[str, MatchSuggestion]] = None
 
         # Index for fast lookups (built during generate_suggestions)
-        self._beacon_by_amount: Dict[Decimal, List[BeaconEntry]] = {}
-        self._beacon_amounts: set = set()
+        # (keyed by amount in pence; _beacon_amounts holds the keys in ascending order)
+        self._beacon_by_amount: Dict[int, List[BeaconEntry]] = {}
+        self._beacon_amounts: List[int] = []
+        # Parsed trans_no numbers by beacon ID, for the 1-to-2 range check
+        # (see _trans_no_numbers; built with the amount index)
+        self._trans_no_numbers_by_id: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+        # Index of beacon entries by trans_no (built in load_data)
+        self._beacon_by_trans_no: Dict[str, BeaconEntry] = {}
+
+        # Indexes of match suggestions by bank and beacon ID (maintained by _add_suggestion)
+        self._matches_by_bank_id: Dict[str, List[MatchSuggestion]] = defaultdict(list)
+        self._matches_by_beacon_id: Dict[str, List[MatchSuggestion]] = defaultdict(list)
+        # Positions in match_suggestions by (match_id, bank_id) and by bank_id
+        # (rebuilt by _sort_suggestions, used by find_match_in_suggestions)
+        self._suggestion_index_by_id: Dict[Tuple[str, str], int] = {}
+        self._suggestion_index_by_bank: Dict[str, List[int]] = {}
+
+        # Pool of surname strings so equal names share one object (see _intern)
+        self._surname_pool: Dict[str, str] = {}
 
         # Progress callback
         self.progress_callback: Optional[Callable[[int, int, str], None]] = None
@@ -208,9 +372,15 @@ class ReconciliationSystem:
         self.date_tolerance_days = self.DEFAULT_DATE_TOLERANCE_DAYS
 
     def load_data(self):
-        """Load transactions from CSV files."""
-        self.bank_transactions = self._load_bank_transactions()
-        self.beacon_entries = self._load_beacon_entries()
+        """Load transactions from CSV files (or from the preloaded lists)."""
+        if self.preloaded is not None:
+            bank_transactions, beacon_entries = self.preloaded
+            self.bank_transactions = list(bank_transactions)
+            self.beacon_entries = list(beacon_entries)
+        else:
+            self.bank_transactions = self._load_bank_transactions()
+            self.beacon_entries = self._load_beacon_entries()
+        self._build_trans_no_index()
         self._load_member_lookup()
         self._load_state()
 
@@ -249,7 +419,7 @@ class ReconciliationSystem:
                 try:
                     # Parse date using multi-format parser
                     date = self._parse_bank_date(row['Date'])
-                    amount = Decimal(row['Amount'].strip().replace(',', ''))
+                    amount = _parse_amount(row['Amount'])
 
                     transaction = BankTransaction(
                         id=f"BANK_{idx:04d}",
@@ -278,7 +448,7 @@ class ReconciliationSystem:
                 try:
                     # Parse date in format DD/MM/YYYY
                     date = datetime.strptime(row['date'].strip(), '%d/%m/%Y')
-                    amount = Decimal(row['amount'].strip().replace(',', ''))
+                    amount = _parse_amount(row['amount'])
 
                     entry = BeaconEntry(
                         id=f"BEACON_{idx:04d}",
@@ -295,6 +465,12 @@ class ReconciliationSystem:
 
         return entries
 
+    def _build_trans_no_index(self):
+        """Build index of beacon entries by trans_no (first entry wins on duplicates)."""
+        self._beacon_by_trans_no = {}
+        for entry in self.beacon_entries:
+            self._beacon_by_trans_no.setdefault(entry.trans_no, entry)
+
     def _load_member_lookup(self):
         """Load member lookup from CSV file."""
         self.member_lookup = {}
@@ -334,8 +510,6 @@ class ReconciliationSystem:
         - Numbers that are part of dates (e.g., "2/12/25", "12/01/2025")
         - Numbers immediately following "Invoice" or "inv"
         """
-        import re
-
         numbers = []
 
         # Extract numbers from U3A references, including AND-separated (e.g., U3A1076AND1077)
@@ -420,14 +594,22 @@ class ReconciliationSystem:
 
         return "\n".join(lines)
 
+    def _state_is_pickle(self) -> bool:
+        """True if the state file is a pickle (.pkl) rather than JSON."""
+        return self.state_file.lower().endswith(_PICKLE_STATE_SUFFIX)
+
     def _load_state(self):
-        """Load saved state from JSON file."""
+        """Load saved state from the JSON (or pickle) state file."""
         if not os.path.exists(self.state_file):
             return
 
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            if self._state_is_pickle():
+                with open(self.state_file, 'rb') as f:
+                    state = pickle.load(f)
+            else:
+                with open(self.state_file, 'r') as f:
+                    state = json.load(f)
 
             # Load matched beacon IDs
             self.matched_beacon_ids = set(state.get('matched_beacon_ids', []))
@@ -438,6 +620,8 @@ class ReconciliationSystem:
                 for m in state.get('confirmed_matches', [])
             ]
 
+            self._invalidate_matched_bank_index()
+
             # Load rejected bank IDs
             self.rejected_bank_ids = set(state.get('rejected_bank_ids', []))
 
@@ -448,15 +632,20 @@ class ReconciliationSystem:
             ]
 
             # Mark beacon entries as matched
+            matched_ids = self.matched_beacon_ids
             for entry in self.beacon_entries:
-                if entry.id in self.matched_beacon_ids:
+                if entry.id in matched_ids:
                     entry.matched = True
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, pickle.UnpicklingError, EOFError, KeyError) as e:
             print(f"Warning: Could not load state: {e}")
 
     def save_state(self):
-        """Save current state to JSON file."""
+        """Save current state to the state file.
+
+        The state is written as JSON, or pickled if the state file ends in .pkl
+        (same content, faster to save and load, but not human-readable).
+        """
         state = {
             'matched_beacon_ids': list(self.matched_beacon_ids),
             'confirmed_matches': [m.to_dict() for m in self.confirmed_matches],
@@ -464,17 +653,23 @@ class ReconciliationSystem:
             'rejected_matches': [m.to_dict() for m in self.rejected_matches]
         }
 
+        if self._state_is_pickle():
+            with open(self.state_file, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            return
+
         with open(self.state_file, 'w') as f:
             json.dump(state, f, indent=2)
 
     def _build_beacon_index(self, available_beacon: List[BeaconEntry]):
-        """Build index of beacon entries by amount for fast lookup."""
+        """Build index of beacon entries by amount (in pence) for fast lookup."""
         self._beacon_by_amount = defaultdict(list)
-        self._beacon_amounts = set()
+        self._trans_no_numbers_by_id = {}
 
         for beacon in available_beacon:
-            self._beacon_by_amount[beacon.amount].append(beacon)
-            self._beacon_amounts.add(beacon.amount)
+            self._beacon_by_amount[beacon.amount_pence].append(beacon)
+            self._trans_no_numbers_by_id[beacon.id] = _trans_no_numbers(beacon.trans_no)
+        self._beacon_amounts = sorted(self._beacon_by_amount)
 
     def _report_progress(self, current: int, total: int, message: str):
         """Report progress if callback is set."""
@@ -547,7 +742,7 @@ class ReconciliationSystem:
 
                 # Generate a suggestion for each matching beacon
                 for beacon in matching_beacons:
-                    if beacon.amount == bank_txn.amount:
+                    if beacon.amount_pence == bank_txn.amount_pence:
                         match = MatchSuggestion(
                             id=f"MATCH_{suggestion_id:04d}",
                             bank_transaction=bank_txn,
@@ -558,7 +753,7 @@ class ReconciliationSystem:
                             date_score=0.5,  # Date not checked here
                             name_score=1.0
                         )
-                        self.match_suggestions.append(match)
+                        self._add_suggestion(match)
                         suggestion_id += 1
                         matched_bank_ids.add(bank_txn.id)
 
@@ -573,7 +768,7 @@ class ReconciliationSystem:
                 # Try to find a pair that sums to the bank amount
                 for b1 in beacons1:
                     for b2 in beacons2:
-                        if b1.id != b2.id and b1.amount + b2.amount == bank_txn.amount:
+                        if b1.id != b2.id and b1.amount_pence + b2.amount_pence == bank_txn.amount_pence:
                             match = MatchSuggestion(
                                 id=f"MATCH_{suggestion_id:04d}",
                                 bank_transaction=bank_txn,
@@ -584,7 +779,7 @@ class ReconciliationSystem:
                                 date_score=0.5,
                                 name_score=1.0
                             )
-                            self.match_suggestions.append(match)
+                            self._add_suggestion(match)
                             suggestion_id += 1
                             matched_bank_ids.add(bank_txn.id)
                             break
@@ -612,13 +807,14 @@ class ReconciliationSystem:
         self.trans_no_limit = trans_no_limit
         if date_tolerance_days is not None:
             self.date_tolerance_days = date_tolerance_days
-        self.match_suggestions = []
+        self._clear_suggestions()
 
         # Clean up confirmed_matches: remove entries that are no longer confirmed
         self.confirmed_matches = [m for m in self.confirmed_matches
                                   if m.status in (MatchStatus.CONFIRMED,
                                                   MatchStatus.MANUAL_MATCH,
                                                   MatchStatus.MANUALLY_RESOLVED)]
+        self._invalidate_matched_bank_index()
 
         # Start suggestion IDs from a number higher than any existing match
         # to avoid ID collisions
@@ -645,8 +841,9 @@ class ReconciliationSystem:
                               if t.id not in confirmed_bank_ids]
 
         # Get available beacon entries (not matched)
+        matched_ids = self.matched_beacon_ids
         available_beacon = [e for e in self.beacon_entries
-                          if e.id not in self.matched_beacon_ids]
+                            if e.id not in matched_ids]
 
         total_bank = len(bank_to_process)
 
@@ -654,7 +851,7 @@ class ReconciliationSystem:
             # If include_confirmed, still add the confirmed matches
             if include_confirmed:
                 for match in self.confirmed_matches:
-                    self.match_suggestions.append(match)
+                    self._add_suggestion(match)
             return self._sort_suggestions()
 
         # Step 1: Generate member number matches first
@@ -681,7 +878,7 @@ class ReconciliationSystem:
                 for match in self.confirmed_matches:
                     if match.bank_transaction.id == bank_txn.id:
                         if match not in self.match_suggestions:
-                            self.match_suggestions.append(match)
+                            self._add_suggestion(match)
                         break
                 continue
 
@@ -701,7 +898,7 @@ class ReconciliationSystem:
             for match in all_matches:
                 if match.confidence_score >= MIN_CONFIDENCE_THRESHOLD:
                     match.id = f"MATCH_{suggestion_id:04d}"
-                    self.match_suggestions.append(match)
+                    self._add_suggestion(match)
                     suggestion_id += 1
                     matches_added += 1
 
@@ -714,7 +911,7 @@ class ReconciliationSystem:
                     confidence_score=0.0,
                     match_type="no-match"
                 )
-                self.match_suggestions.append(suggestion)
+                self._add_suggestion(suggestion)
                 suggestion_id += 1
 
         # Auto-confirm high-confidence matches (only if requested)
@@ -727,6 +924,21 @@ class ReconciliationSystem:
 
         return self._sort_suggestions()
 
+    def _clear_suggestions(self):
+        """Reset match suggestions and their bank/beacon indexes."""
+        self.match_suggestions = []
+        self._matches_by_bank_id = defaultdict(list)
+        self._matches_by_beacon_id = defaultdict(list)
+        self._suggestion_index_by_id = {}
+        self._suggestion_index_by_bank = {}
+
+    def _add_suggestion(self, match: MatchSuggestion):
+        """Append a match suggestion and index it by bank and beacon ID."""
+        self.match_suggestions.append(match)
+        self._matches_by_bank_id[match.bank_transaction.id].append(match)
+        for beacon in match.beacon_entries:
+            self._matches_by_beacon_id[beacon.id].append(match)
+
     def _sort_suggestions(self) -> List[MatchSuggestion]:
         """Sort suggestions by bank transaction, then status, then confidence."""
         # Status priority: confirmed=0, pending=1, skipped=2, rejected=3
@@ -742,16 +954,40 @@ class ReconciliationSystem:
             status_priority.get(m.status, 1),  # Then by status priority
             -m.confidence_score  # Then by confidence (highest first, hence negative)
         ))
+        self._build_suggestion_position_index()
 
         return self.match_suggestions
 
+    def _build_suggestion_position_index(self):
+        """Index positions in match_suggestions for find_match_in_suggestions."""
+        by_id = {}
+        by_bank = defaultdict(list)
+        for i, suggestion in enumerate(self.match_suggestions):
+            bank_id = suggestion.bank_transaction.id
+            by_id.setdefault((suggestion.id, bank_id), i)  # First occurrence wins
+            by_bank[bank_id].append(i)
+        self._suggestion_index_by_id = by_id
+        self._suggestion_index_by_bank = dict(by_bank)
+
     def _restore_rejected_status(self):
         """Restore REJECTED status for previously rejected bank transactions."""
+        if not self.rejected_bank_ids:
+            return
+
+        # Equal matches have equal bank transactions, so each suggestion only
+        # needs comparing with the rejected matches for its own bank
+        rejected_by_bank = defaultdict(list)
+        for rejected in self.rejected_matches:
+            rejected_by_bank[rejected.bank_transaction.id].append(rejected)
+
         for match in self.match_suggestions:
-            if match.bank_transaction.id in self.rejected_bank_ids:
+            bank_id = match.bank_transaction.id
+            if bank_id in self.rejected_bank_ids:
                 if match.status == MatchStatus.PENDING:
                     match.status = MatchStatus.REJECTED
-                    if match not in self.rejected_matches:
+                    same_bank = rejected_by_bank[bank_id]
+                    if match not in same_bank:
+                        same_bank.append(match)
                         self.rejected_matches.append(match)
 
     def _find_one_to_one_matches_fast(self, bank_txn: BankTransaction) -> List[MatchSuggestion]:
@@ -759,12 +995,13 @@ class ReconciliationSystem:
         matches = []
 
         # Only look at beacon entries with matching amount
-        if bank_txn.amount not in self._beacon_by_amount:
+        beacons = self._beacon_by_amount.get(bank_txn.amount_pence)
+        if not beacons:
             return matches
 
-        for beacon in self._beacon_by_amount[bank_txn.amount]:
+        for beacon in beacons:
             # Calculate date score first (fast rejection)
-            date_score = self._calculate_date_score(bank_txn.date, beacon.date)
+            date_score = self._date_score_for_days(beacon.date_ord - bank_txn.date_ord)
             if date_score == 0:
                 continue  # Outside date tolerance
 
@@ -800,87 +1037,91 @@ class ReconciliationSystem:
         Returns True if both trans_no values can be converted to integers and
         their absolute difference is <= max_diff. Returns False otherwise.
         """
-        try:
-            # Try direct integer conversion (works for pure numbers)
-            num1 = int(trans_no1)
-            num2 = int(trans_no2)
-            return abs(num1 - num2) <= max_diff
-        except (ValueError, TypeError):
-            # Fall back to extracting numeric part for prefixed formats like "TRN001"
-            import re
-            match1 = re.search(r'(\d+)', str(trans_no1))
-            match2 = re.search(r'(\d+)', str(trans_no2))
-            if match1 and match2:
-                return abs(int(match1.group(1)) - int(match2.group(1))) <= max_diff
-            return False
+        return self._trans_no_numbers_within_range(
+            _trans_no_numbers(trans_no1), _trans_no_numbers(trans_no2), max_diff
+        )
+
+    @staticmethod
+    def _trans_no_numbers_within_range(numbers1: Tuple[Optional[int], Optional[int]],
+                                       numbers2: Tuple[Optional[int], Optional[int]],
+                                       max_diff: int) -> bool:
+        """_trans_no_within_range for values already parsed by _trans_no_numbers."""
+        # Direct integer values (pure numbers)
+        if numbers1[0] is not None and numbers2[0] is not None:
+            return abs(numbers1[0] - numbers2[0]) <= max_diff
+        # Otherwise the numeric parts of prefixed formats like "TRN001"
+        if numbers1[1] is not None and numbers2[1] is not None:
+            return abs(numbers1[1] - numbers2[1]) <= max_diff
+        return False
 
     def _find_one_to_two_matches_fast(self, bank_txn: BankTransaction) -> List[MatchSuggestion]:
         """Find 1-to-2 matches using indexed lookup (optimized)."""
         matches = []
-        bank_amount = bank_txn.amount
-        bank_date = bank_txn.date
-
-        # For each unique amount in beacon entries
-        checked_pairs = set()
-
+        bank_amount = bank_txn.amount_pence
+        bank_date_ord = bank_txn.date_ord
+
+        trans_no_numbers = self._trans_no_numbers_by_id
+        within_range = self._trans_no_numbers_within_range
+        trans_no_limit = self.trans_no_limit
+
+        # Beacons within the date window for each amount, with their date
+        # scores and parsed trans_no, so each beacon is scored once rather
+        # than once per pair
+        in_window = {}
+
+        def beacons_in_window(amount):
+            candidates = in_window.get(amount)
+            if candidates is None:
+                candidates = []
+                for beacon in self._beacon_by_amount[amount]:
+                    date_score = self._date_score_for_days(beacon.date_ord - bank_date_ord)
+                    if date_score != 0:
+                        candidates.append((beacon, date_score, trans_no_numbers[beacon.id]))
+                in_window[amount] = candidates
+            return candidates
+
+        # Meet in the middle: walk the unique amounts in ascending order up to
+        # half the bank amount and look up the complement, so each amount
+        # pair is visited once with amount1 <= amount2
         for amount1 in self._beacon_amounts:
             amount2 = bank_amount - amount1
+            if amount1 > amount2:
+                break
 
-            # Skip if amount2 doesn't exist or if we've already checked this pair
-            if amount2 not in self._beacon_amounts:
+            # Skip if amount2 doesn't exist
+            if amount2 not in self._beacon_by_amount:
                 continue
 
-            pair_key = tuple(sorted([amount1, amount2]))
-            if pair_key in checked_pairs:
+            # Get in-window beacons with these amounts
+            beacons1 = beacons_in_window(amount1)
+            if not beacons1:
                 continue
-            checked_pairs.add(pair_key)
-
-            # Get beacons with these amounts
-            beacons1 = self._beacon_by_amount[amount1]
-            beacons2 = self._beacon_by_amount[amount2]
 
             # If same amount, need to handle differently
             if amount1 == amount2:
                 # Pairs from same list
-                for i, b1 in enumerate(beacons1):
-                    # Check date early for b1
-                    date_score1 = self._calculate_date_score(bank_date, b1.date)
-                    if date_score1 == 0:
-                        continue
-
-                    for b2 in beacons1[i+1:]:
-                        # Check if trans_no values are within 3 of each other
-                        if not self._trans_no_within_range(b1.trans_no, b2.trans_no, self.trans_no_limit):
-                            continue
-
-                        # Check date early for b2
-                        date_score2 = self._calculate_date_score(bank_date, b2.date)
-                        if date_score2 == 0:
-                            continue
-
-                        match = self._create_two_match(bank_txn, b1, b2, date_score1, date_score2)
-                        if match:
-                            matches.append(match)
+                pairs = (
+                    (first, second)
+                    for i, first in enumerate(beacons1)
+                    for second in beacons1[i+1:]
+                )
             else:
                 # Pairs from different lists
-                for b1 in beacons1:
-                    date_score1 = self._calculate_date_score(bank_date, b1.date)
-                    if date_score1 == 0:
-                        continue
-
-                    for b2 in beacons2:
-                        # Check if trans_no values are within 3 of each other
-                        if not self._trans_no_within_range(b1.trans_no, b2.trans_no, self.trans_no_limit):
-                            continue
+                beacons2 = beacons_in_window(amount2)
+                pairs = (
+                    (first, second)
+                    for first in beacons1
+                    for second in beacons2
+                )
 
-                        # Check date early for b2
-                        date_score2 = self._calculate_date_score(bank_date, b2.date)
-                        if date_score2 == 0:
-                            continue
+            for (b1, date_score1, numbers1), (b2, date_score2, numbers2) in pairs:
+                # Check if trans_no values are within the limit of each other
+                if not within_range(numbers1, numbers2, trans_no_limit):
+                    continue
 
-                        match = self._create_two_match(bank_txn, b1, b2, date_score1, date_score2)
-                        if match:
-                            matches.append(match)
+                match = self._create_two_match(bank_txn, b1, b2, date_score1, date_score2)
+                if match:
+                    matches.append(match)
 
         return matches
 
@@ -981,7 +1222,13 @@ class ReconciliationSystem:
         The date_tolerance_days setting controls the maximum allowed date difference.
         """
         # Positive = beacon after bank (normal), negative = beacon before bank (unusual)
-        days_diff = (beacon_date - bank_date).days
+        return self._date_score_for_days((beacon_date - bank_date).days)
+
+    def _date_score_for_days(self, days_diff: int) -> float:
+        """_calculate_date_score for a precomputed beacon-minus-bank day difference.
+
+        The matching loops pass the difference of the cached date_ord values.
+        """
         tolerance = self.date_tolerance_days
 
         if days_diff >= 0:
@@ -1037,12 +1284,18 @@ class ReconciliationSystem:
         if not bank_surnames or not beacon_surnames:
             return 0.3  # No names available, neutral score
 
+        # Longest names first: they are the only ones eligible for prefix,
+        # substring and fuzzy matching, so a strong match is found sooner.
+        # The lower-case forms compared below are the ones interned.
+        bank_names = sorted((self._intern(n.lower()) for n in bank_surnames), key=len, reverse=True)
+        beacon_names = sorted((self._intern(n.lower()) for n in beacon_surnames), key=len, reverse=True)
+
         # Check each bank surname against each beacon surname
         best_score = 0.0
 
-        for bank_name in bank_surnames:
-            for beacon_name in beacon_surnames:
-                score = self._compare_surnames(bank_name.lower(), beacon_name.lower())
+        for bank_name in bank_names:
+            for beacon_name in beacon_names:
+                score = self._compare_surnames(bank_name, beacon_name, score_cutoff=best_score)
                 if score > best_score:
                     best_score = score
                     if best_score >= 0.9:
@@ -1050,21 +1303,29 @@ class ReconciliationSystem:
 
         return best_score
 
-    def _compare_surnames(self, bank_surname: str, beacon_surname: str) -> float:
+    def _compare_surnames(self, bank_surname: str, beacon_surname: str,
+                          score_cutoff: float = 0.0) -> float:
         """Compare two surnames and return a similarity score (0-1).
 
         Handles:
         - Exact matches
         - Truncated names (bank names can be truncated, e.g., ABERCROMB vs ABERCROMBIE)
         - Typo tolerance for longer surnames
+
+        Checks that cannot score above score_cutoff are skipped, in which
+        case 0.0 is returned.
         """
         if not bank_surname or not beacon_surname:
             return 0.0
 
-        # Exact match
+        # Exact match (names are interned, so == usually succeeds on identity)
         if bank_surname == beacon_surname:
             return 0.9  # Surname matches
 
+        # Only an exact match can beat a truncation match
+        if score_cutoff >= 0.85:
+            return 0.0
+
         # Prefix matching for truncated bank names (at least 5 chars to avoid false positives)
         # Bank names are often truncated, so check if either is a prefix of the other
         if len(bank_surname) >= 5 and len(beacon_surname) >= 5:
@@ -1080,9 +1341,14 @@ class ReconciliationSystem:
         # Typo tolerance for longer surnames (6+ chars)
         # Short surnames (5 chars or less) need exact match - one letter difference
         # in "BARRY" vs "PARRY" is a completely different person
-        if len(bank_surname) >= 6 and len(beacon_surname) >= 6:
-            similarity = SequenceMatcher(None, bank_surname, beacon_surname).ratio()
-            # Require very high similarity (90%+) for fuzzy match
+        if len(bank_surname) >= 6 and len(beacon_surname) >= 6 and score_cutoff < 0.7:
+            # Require very high similarity (90%+) for fuzzy match.
+            # real_quick_ratio() and quick_ratio() are cheap upper bounds on
+            # ratio(), so most non-matching pairs are rejected without it.
+            matcher = SequenceMatcher(None, bank_surname, beacon_surname)
+            if matcher.real_quick_ratio() < 0.9 or matcher.quick_ratio() < 0.9:
+                return 0.0
+            similarity = matcher.ratio()
             if similarity >= 0.9:
                 return similarity * 0.7  # Cap at ~0.7 for fuzzy matches
 
@@ -1097,35 +1363,31 @@ class ReconciliationSystem:
         "SURNAME FIRSTNAME" orderings, as well as family member matching
         (e.g., account holder Margaret Kinnear paying for member Ruth Kinnear).
         """
-        import re
-
         # Clean the text: remove U3A references, SUBS, REFUND, and numbers
-        clean_text = re.sub(r'\bu3a\d*\b', '', text, flags=re.IGNORECASE)
-        clean_text = re.sub(r'\bsubs?\b', '', clean_text, flags=re.IGNORECASE)
-        clean_text = re.sub(r'\brefunds?\b', '', clean_text, flags=re.IGNORECASE)
-        clean_text = re.sub(r'\b\d+(/\d+)?\b', '', clean_text)
-        clean_text = re.sub(r'[-]', ' ', clean_text)
-        clean_text = ' '.join(clean_text.split())
+        clean_text = _U3A_RE.sub('', text)
+        clean_text = _SUBS_RE.sub('', clean_text)
+        clean_text = _REFUND_RE.sub('', clean_text)
+        clean_text = _NUM_RE.sub('', clean_text)
+        clean_text = _DASH_RE.sub(' ', clean_text)
 
         parts = clean_text.split()
 
-        # Noise words that should not be considered as names
-        noise_words = {
-            'PAYMENT', 'TRANSFER', 'CREDIT', 'DEBIT', 'REF', 'FT', 'TFR',
-            'MISS', 'MR', 'MRS', 'MS', 'DR', 'PROF',
-            'THE', 'AND', 'FOR', 'WITH'
-        }
-
         # Accept words with letters and apostrophes (for O'Carroll, etc.)
         potential_surnames = []
         for p in parts:
             # Allow apostrophes in names
-            clean_p = re.sub(r"'", '', p)  # Remove apostrophe for validation
-            if re.match(r'^[A-Za-z]+$', clean_p) and len(p) > 2 and p.upper() not in noise_words:
-                potential_surnames.append(p.upper())
+            clean_p = _APOS_RE.sub('', p)  # Remove apostrophe for validation
+            if _WORD_RE.match(clean_p) and len(p) > 2:
+                upper = p.upper()
+                if upper not in _NOISE_WORDS:
+                    potential_surnames.append(upper)
 
         return potential_surnames
 
+    def _intern(self, name: str) -> str:
+        """Return the pooled copy of a surname string, adding it if new."""
+        return self._surname_pool.setdefault(name, name)
+
     def _extract_name(self, description: str) -> str:
         """Extract name from bank description.
 
@@ -1172,66 +1434,65 @@ class ReconciliationSystem:
     def confirm_match(self, match: MatchSuggestion):
         """Confirm a match and mark beacon entries as matched."""
         match.status = MatchStatus.CONFIRMED
-        print(f"[DEBUG] confirm_match: set {match.id} status to CONFIRMED")
+        if DEBUG:
+            debug_log(f"confirm_match: set {match.id} status to CONFIRMED")
         self.confirmed_matches.append(match)
+        self._invalidate_matched_bank_index()
 
         # Mark beacon entries as matched
-        confirmed_beacon_ids = set()
+        confirmed_beacon_ids = []
         for beacon in match.beacon_entries:
             self.matched_beacon_ids.add(beacon.id)
-            confirmed_beacon_ids.add(beacon.id)
+            confirmed_beacon_ids.append(beacon.id)
             beacon.matched = True
 
         # Auto-reject any other pending matches that involve these beacon entries
-        print(f"[DEBUG] confirm_match: calling _reject_matches_with_beacons, match status={match.status}")
         self._reject_matches_with_beacons(confirmed_beacon_ids, exclude_match=match)
-        print(f"[DEBUG] confirm_match: after _reject_matches_with_beacons, match status={match.status}")
 
         # Auto-reject any other pending matches for this bank transaction
-        print(f"[DEBUG] confirm_match: calling _reject_matches_for_bank, match status={match.status}")
         self._reject_matches_for_bank(match.bank_transaction.id, exclude_match=match)
-        print(f"[DEBUG] confirm_match: after _reject_matches_for_bank, match status={match.status}")
 
     def _reject_matches_for_bank(self, bank_id: str, exclude_match: MatchSuggestion = None):
         """Reject all pending matches for the specified bank transaction."""
-        for suggestion in self.match_suggestions:
+        for suggestion in self._matches_by_bank_id.get(bank_id, ()):
             # Use identity comparison (is) not value comparison (==)
             # because dataclass == compares all fields including status
             if suggestion is exclude_match:
-                print(f"[DEBUG] _reject_matches_for_bank: skipping {suggestion.id} (is exclude_match)")
                 continue
             if suggestion.status != MatchStatus.PENDING:
                 continue
 
-            if suggestion.bank_transaction.id == bank_id:
-                print(f"[DEBUG] _reject_matches_for_bank: rejecting {suggestion.id} for bank {bank_id}")
+            suggestion.status = MatchStatus.REJECTED
+            self.rejected_bank_ids.add(bank_id)
+            if suggestion not in self.rejected_matches:
+                self.rejected_matches.append(suggestion)
+
+    def _reject_matches_with_beacons(self, beacon_ids: List[str], exclude_match: MatchSuggestion = None):
+        """Reject all pending matches that involve any of the specified beacon entries.
+
+        beacon_ids is walked in order (not as a set), so rejected_matches - and
+        the saved state - come out in the same order on every run.
+        """
+        for beacon_id in beacon_ids:
+            for suggestion in self._matches_by_beacon_id.get(beacon_id, ()):
+                # Use identity comparison (is) not value comparison (==)
+                # because dataclass == compares all fields including status.
+                # A suggestion already rejected via another beacon is skipped
+                # by the status check.
+                if suggestion is exclude_match:
+                    continue
+                if suggestion.status != MatchStatus.PENDING:
+                    continue
+
                 suggestion.status = MatchStatus.REJECTED
-                self.rejected_bank_ids.add(bank_id)
+                self.rejected_bank_ids.add(suggestion.bank_transaction.id)
                 if suggestion not in self.rejected_matches:
                     self.rejected_matches.append(suggestion)
 
-    def _reject_matches_with_beacons(self, beacon_ids: set, exclude_match: MatchSuggestion = None):
-        """Reject all pending matches that involve any of the specified beacon entries."""
-        for suggestion in self.match_suggestions:
-            # Use identity comparison (is) not value comparison (==)
-            # because dataclass == compares all fields including status
-            if suggestion is exclude_match:
-                continue
-            if suggestion.status != MatchStatus.PENDING:
-                continue
-
-            # Check if this match involves any of the beacon entries
-            for beacon in suggestion.beacon_entries:
-                if beacon.id in beacon_ids:
-                    suggestion.status = MatchStatus.REJECTED
-                    self.rejected_bank_ids.add(suggestion.bank_transaction.id)
-                    if suggestion not in self.rejected_matches:
-                        self.rejected_matches.append(suggestion)
-                    break
-
     def reject_match(self, match: MatchSuggestion):
         """Reject a match suggestion."""
         match.status = MatchStatus.REJECTED
+        self._invalidate_matched_bank_index()
         self.rejected_bank_ids.add(match.bank_transaction.id)
         if match not in self.rejected_matches:
             self.rejected_matches.append(match)
@@ -1239,11 +1500,13 @@ class ReconciliationSystem:
     def skip_match(self, match: MatchSuggestion):
         """Skip a match for later review."""
         match.status = MatchStatus.SKIPPED
+        self._invalidate_matched_bank_index()
 
     def undo_confirmation(self, match: MatchSuggestion):
         """Undo a confirmed match."""
         if match in self.confirmed_matches:
             self.confirmed_matches.remove(match)
+        self._invalidate_matched_bank_index()
 
         # Unmark beacon entries
         for beacon in match.beacon_entries:
@@ -1254,104 +1517,90 @@ class ReconciliationSystem:
 
     def undo_rejection(self, match: MatchSuggestion):
         """Undo a rejected match."""
-        print(f"[DEBUG] undo_rejection: {match.id}, in rejected_matches={match in self.rejected_matches}")
         if match in self.rejected_matches:
             self.rejected_matches.remove(match)
-            print(f"[DEBUG] undo_rejection: removed from rejected_matches")
-        else:
-            print(f"[DEBUG] undo_rejection: NOT in rejected_matches! len={len(self.rejected_matches)}")
+        elif DEBUG:
+            debug_log(f"undo_rejection: {match.id} NOT in rejected_matches! len={len(self.rejected_matches)}")
             # Check if there's a match with same ID
             for rm in self.rejected_matches:
                 if rm.id == match.id:
-                    print(f"[DEBUG] undo_rejection: found match by ID, same object={rm is match}")
+                    debug_log(f"undo_rejection: found match by ID, same object={rm is match}")
                     break
 
         self.rejected_bank_ids.discard(match.bank_transaction.id)
         match.status = MatchStatus.PENDING
-        print(f"[DEBUG] undo_rejection: set status to PENDING")
 
     def update_match_status(self, match: MatchSuggestion, new_status: MatchStatus):
         """Update match status with proper handling."""
         old_status = match.status
-        print(f"[DEBUG] update_match_status: {match.id} from {old_status} to {new_status}")
+        if DEBUG:
+            debug_log(f"update_match_status: {match.id} from {old_status} to {new_status}")
 
         # If changing from confirmed, undo the confirmation first
         if old_status == MatchStatus.CONFIRMED and new_status != MatchStatus.CONFIRMED:
-            print(f"[DEBUG]   -> undo_confirmation")
             self.undo_confirmation(match)
 
         # If changing from manual match, undo similarly (unmark beacons)
         if old_status == MatchStatus.MANUAL_MATCH and new_status != MatchStatus.MANUAL_MATCH:
-            print(f"[DEBUG]   -> undo manual match")
             self.undo_confirmation(match)  # Same logic as confirmed
 
         # If changing from manually resolved, remove from confirmed
         if old_status == MatchStatus.MANUALLY_RESOLVED and new_status != MatchStatus.MANUALLY_RESOLVED:
-            print(f"[DEBUG]   -> undo manually resolved")
             if match in self.confirmed_matches:
                 self.confirmed_matches.remove(match)
             match.status = MatchStatus.PENDING
 
         # If changing from rejected, undo the rejection first
         if old_status == MatchStatus.REJECTED and new_status != MatchStatus.REJECTED:
-            print(f"[DEBUG]   -> undo_rejection")
             self.undo_rejection(match)
-            print(f"[DEBUG]   -> after undo_rejection: status={match.status}")
 
         # If changing to confirmed, confirm the match
         if new_status == MatchStatus.CONFIRMED and old_status != MatchStatus.CONFIRMED:
-            print(f"[DEBUG]   -> confirm_match")
             self.confirm_match(match)
-            print(f"[DEBUG]   -> after confirm_match: status={match.status}")
         # If changing to rejected, reject the match
         elif new_status == MatchStatus.REJECTED and old_status != MatchStatus.REJECTED:
-            print(f"[DEBUG]   -> reject_match")
             self.reject_match(match)
         else:
             match.status = new_status
 
-        print(f"[DEBUG]   -> final status: {match.status}")
+        self._invalidate_matched_bank_index()
+
+        if DEBUG:
+            debug_log(f"update_match_status: {match.id} final status {match.status}")
 
     def get_statistics(self) -> Dict:
         """Get reconciliation statistics including amount totals."""
-        from decimal import Decimal
-
         total_bank = len(self.bank_transactions)
         total_beacon = len(self.beacon_entries)
 
-        # Count different types of confirmed matches and their amounts
-        confirmed_auto = [m for m in self.confirmed_matches
-                         if m.status == MatchStatus.CONFIRMED]
-        manual_matches = [m for m in self.confirmed_matches
-                         if m.status == MatchStatus.MANUAL_MATCH]
-        manually_resolved = [m for m in self.confirmed_matches
-                            if m.status == MatchStatus.MANUALLY_RESOLVED]
-
-        confirmed_count = len(confirmed_auto) + len(manual_matches) + len(manually_resolved)
-        confirmed_amount = sum(m.bank_transaction.amount for m in confirmed_auto)
-        manual_amount = sum(m.bank_transaction.amount for m in manual_matches)
-        resolved_amount = sum(m.bank_transaction.amount for m in manually_resolved)
-        total_confirmed_amount = confirmed_amount + manual_amount + resolved_amount
+        # Count confirmed matches and pending/rejected/skipped suggestions by
+        # status, with their bank amounts, in one pass over each list
+        confirmed_counts = Counter()
+        confirmed_amounts = defaultdict(Decimal)
+        confirmed_bank_ids = set()
+        for m in self.confirmed_matches:
+            confirmed_counts[m.status] += 1
+            confirmed_amounts[m.status] += m.bank_transaction.amount
+            confirmed_bank_ids.add(m.bank_transaction.id)
+
+        suggestion_counts = Counter()
+        suggestion_amounts = defaultdict(Decimal)
+        for m in self.match_suggestions:
+            suggestion_counts[m.status] += 1
+            suggestion_amounts[m.status] += m.bank_transaction.amount
+
+        confirmed_count = (confirmed_counts[MatchStatus.CONFIRMED] +
+                           confirmed_counts[MatchStatus.MANUAL_MATCH] +
+                           confirmed_counts[MatchStatus.MANUALLY_RESOLVED])
+        total_confirmed_amount = (confirmed_amounts[MatchStatus.CONFIRMED] +
+                                  confirmed_amounts[MatchStatus.MANUAL_MATCH] +
+                                  confirmed_amounts[MatchStatus.MANUALLY_RESOLVED])
 
         matched_beacon = len(self.matched_beacon_ids)
 
-        # Pending suggestions and their amounts
-        pending = [m for m in self.match_suggestions
-                  if m.status == MatchStatus.PENDING]
-        pending_amount = sum(m.bank_transaction.amount for m in pending)
-
-        rejected = [m for m in self.match_suggestions
-                   if m.status == MatchStatus.REJECTED]
-        rejected_amount = sum(m.bank_transaction.amount for m in rejected)
-
-        skipped = [m for m in self.match_suggestions
-                  if m.status == MatchStatus.SKIPPED]
-        skipped_amount = sum(m.bank_transaction.amount for m in skipped)
-
         # Unmatched amounts
         unmatched_bank_count = total_bank - confirmed_count
         # Calculate unmatched bank amount from actual unmatched transactions
-        confirmed_bank_ids = {m.bank_transaction.id for m in self.confirmed_matches}
         unmatched_bank_amount = sum(b.amount for b in self.bank_transactions
                                     if b.id not in confirmed_bank_ids)
 
@@ -1360,16 +1609,16 @@ class ReconciliationSystem:
             'total_beacon_entries': total_beacon,
             'confirmed_matches': confirmed_count,
             'confirmed_amount': total_confirmed_amount,
-            'auto_confirmed': len(confirmed_auto),
-            'manual_matches': len(manual_matches),
-            'manually_resolved': len(manually_resolved),
+            'auto_confirmed': confirmed_counts[MatchStatus.CONFIRMED],
+            'manual_matches': confirmed_counts[MatchStatus.MANUAL_MATCH],
+            'manually_resolved': confirmed_counts[MatchStatus.MANUALLY_RESOLVED],
             'matched_beacon_entries': matched_beacon,
-            'pending_suggestions': len(pending),
-            'pending_amount': pending_amount,
-            'rejected_suggestions': len(rejected),
-            'rejected_amount': rejected_amount,
-            'skipped_suggestions': len(skipped),
-            'skipped_amount': skipped_amount,
+            'pending_suggestions': suggestion_counts[MatchStatus.PENDING],
+            'pending_amount': suggestion_amounts[MatchStatus.PENDING],
+            'rejected_suggestions': suggestion_counts[MatchStatus.REJECTED],
+            'rejected_amount': suggestion_amounts[MatchStatus.REJECTED],
+            'skipped_suggestions': suggestion_counts[MatchStatus.SKIPPED],
+            'skipped_amount': suggestion_amounts[MatchStatus.SKIPPED],
             'unmatched_bank': unmatched_bank_count,
             'unmatched_bank_amount': unmatched_bank_amount,
             'unmatched_beacon': total_beacon - matched_beacon
@@ -1380,7 +1629,8 @@ class ReconciliationSystem:
         if output_file is None:
             output_file = os.path.join(self.base_dir, "reconciliation_results.csv")
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        with open(output_file, 'w', newline='', encoding='utf-8',
+                  buffering=_CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
 
             # Header
@@ -1392,25 +1642,23 @@ class ReconciliationSystem:
             ])
 
             # Write matches
-            for match in self.match_suggestions:
-                bank = match.bank_transaction
-                b1 = match.beacon_entries[0] if match.beacon_entries else None
-                b2 = match.beacon_entries[1] if len(match.beacon_entries) > 1 else None
-
-                writer.writerow([
-                    bank.id, bank.date.strftime('%d-%b-%y'),
-                    bank.description, str(bank.amount),
-                    match.match_type, match.status.value,
-                    f"{match.confidence_score:.2f}",
-                    b1.id if b1 else '',
-                    b1.date.strftime('%d/%m/%Y') if b1 else '',
-                    b1.payee if b1 else '',
-                    str(b1.amount) if b1 else '',
-                    b2.id if b2 else '',
-                    b2.date.strftime('%d/%m/%Y') if b2 else '',
-                    b2.payee if b2 else '',
-                    str(b2.amount) if b2 else ''
-                ])
+            writer.writerows(self._export_result_row(match) for match in self.match_suggestions)
+
+    @staticmethod
+    def _export_result_row(match: MatchSuggestion) -> tuple:
+        """Build one export_results row for a match suggestion."""
+        bank = match.bank_transaction
+        beacons = match.beacon_entries
+        row = (
+            bank.id, bank.date.strftime('%d-%b-%y'),
+            bank.description, str(bank.amount),
+            match.match_type, match.status.value,
+            f"{match.confidence_score:.2f}",
+        )
+        # Beacon 1 and Beacon 2 columns, empty when not present
+        for beacon in beacons[:2]:
+            row += (beacon.id, beacon.formatted_date(), beacon.payee, str(beacon.amount))
+        return row + ('', '', '', '') * (2 - min(len(beacons), 2))
 
     def check_consistency(self, progress_callback: Callable[[int, int, str], None] = None) -> List[Tuple['MatchSuggestion', str, List['MatchSuggestion']]]:
         """Check for inconsistencies in confirmed matches.
@@ -1425,29 +1673,42 @@ class ReconciliationSystem:
         2. Each confirmed match has bank amount = sum of beacon amounts
         """
         inconsistencies = []
+        # (match_id, reason) keys already in inconsistencies, shared by both checks
+        seen: set = set()
+
+        def add_inconsistency(primary: MatchSuggestion, reason: str, related: List[MatchSuggestion]):
+            """Record an inconsistency unless the same (match, reason) is already recorded."""
+            key = (primary.id, reason)
+            if key not in seen:
+                seen.add(key)
+                inconsistencies.append((primary, reason, related))
 
         # Filter to only actually confirmed matches (confirmed_matches list may contain
-        # stale entries due to object identity issues when matches are un-confirmed)
-        actually_confirmed = [m for m in self.confirmed_matches if m.status == MatchStatus.CONFIRMED]
+        # stale entries due to object identity issues when matches are un-confirmed),
+        # and in the same pass build a map of beacon_id -> list of confirmed matches
+        # that include it. This is rebuilt from confirmed_matches on every call
+        # rather than maintained incrementally, so it reflects exactly what is
+        # stored, including entries loaded from a state file.
+        actually_confirmed = []
+        beacon_to_matches: Dict[str, List[MatchSuggestion]] = defaultdict(list)
+        for match in self.confirmed_matches:
+            if match.status == MatchStatus.CONFIRMED:
+                actually_confirmed.append(match)
+                for beacon in match.beacon_entries:
+                    beacon_to_matches[beacon.id].append(match)
 
         total_checks = len(actually_confirmed) * 2  # Two checks per match
         current_check = 0
+        # Report progress about 200 times in total rather than on every check
+        progress_step = max(1, total_checks // 200)
 
         debug_log(f"check_consistency: {len(self.confirmed_matches)} in confirmed_matches list, {len(actually_confirmed)} actually CONFIRMED")
 
-        # Build a map of beacon_id -> list of confirmed matches that include it
-        beacon_to_matches: Dict[str, List[MatchSuggestion]] = {}
-        for match in actually_confirmed:
-            for beacon in match.beacon_entries:
-                if beacon.id not in beacon_to_matches:
-                    beacon_to_matches[beacon.id] = []
-                beacon_to_matches[beacon.id].append(match)
-
         # Check 1: Each beacon should be in at most one confirmed match
         checked_beacons = set()
         for match in actually_confirmed:
             current_check += 1
-            if progress_callback:
+            if progress_callback and current_check % progress_step == 0:
                 progress_callback(current_check, total_checks, "Checking beacon uniqueness...")
 
             for beacon in match.beacon_entries:
@@ -1455,7 +1716,7 @@ class ReconciliationSystem:
                     continue
                 checked_beacons.add(beacon.id)
 
-                matches_with_beacon = beacon_to_matches.get(beacon.id, [])
+                matches_with_beacon = beacon_to_matches[beacon.id]
                 if len(matches_with_beacon) > 1:
                     # This beacon is in multiple confirmed matches
                     match_ids = [m.id for m in matches_with_beacon]
@@ -1465,30 +1726,29 @@ class ReconciliationSystem:
                     reason = f"Beacon {beacon.id} ({beacon.payee}, £{beacon.amount}) is confirmed in multiple matches: {', '.join(match_ids)}"
                     # Add ONE entry per beacon issue (use first match as primary)
                     # Include all related matches for navigation
-                    entry = (matches_with_beacon[0], reason, matches_with_beacon)
-                    # Check if this exact entry is already in inconsistencies
-                    if not any(existing[0].id == entry[0].id and existing[1] == reason for existing in inconsistencies):
-                        inconsistencies.append(entry)
+                    add_inconsistency(matches_with_beacon[0], reason, matches_with_beacon)
 
-        # Check 2: Bank amount should equal sum of beacon amounts
+        # Check 2: Bank amount should equal sum of beacon amounts.
+        # Scan first, then build messages only for the mismatches.
+        mismatched = []
         for match in actually_confirmed:
             current_check += 1
-            if progress_callback:
+            if progress_callback and current_check % progress_step == 0:
                 progress_callback(current_check, total_checks, "Checking amount consistency...")
+            if match.beacon_entries and match.bank_transaction.amount != match.beacon_total:
+                mismatched.append(match)
 
-            if not match.beacon_entries:
-                continue
+        # Make sure the final progress update shows completion
+        if progress_callback and total_checks and current_check % progress_step != 0:
+            progress_callback(current_check, total_checks, "Checking amount consistency...")
 
+        for match in mismatched:
             bank_amount = match.bank_transaction.amount
-            beacon_total = sum(b.amount for b in match.beacon_entries)
-
-            if bank_amount != beacon_total:
-                print(f"[DEBUG] Amount mismatch for {match.id}: bank £{bank_amount} != beacon total £{beacon_total}")
-                reason = f"Amount mismatch: Bank £{bank_amount} != Beacon total £{beacon_total}"
-                # Only one match involved in amount mismatch
-                entry = (match, reason, [match])
-                if not any(existing[0].id == match.id and existing[1] == reason for existing in inconsistencies):
-                    inconsistencies.append(entry)
+            beacon_total = match.beacon_total
+            debug_log(f"Amount mismatch for {match.id}: bank £{bank_amount} != beacon total £{beacon_total}")
+            reason = f"Amount mismatch: Bank £{bank_amount} != Beacon total £{beacon_total}"
+            # Only one match involved in amount mismatch
+            add_inconsistency(match, reason, [match])
 
         debug_log(f"check_consistency: found {len(inconsistencies)} inconsistencies")
         return inconsistencies
@@ -1502,28 +1762,30 @@ class ReconciliationSystem:
         where multiple matches have the same ID (can happen when suggestions
         are regenerated).
         """
-        beacon_ids = [b.id for b in match.beacon_entries]
-        debug_log(f"find_match_in_suggestions: looking for {match.id}, bank={match.bank_transaction.id}, beacons={beacon_ids}")
+        if DEBUG:
+            beacon_ids = [b.id for b in match.beacon_entries]
+            debug_log(f"find_match_in_suggestions: looking for {match.id}, bank={match.bank_transaction.id}, beacons={beacon_ids}")
+
+        bank_id = match.bank_transaction.id
 
         # First try to find by both match ID and bank transaction ID (most reliable)
-        for i, suggestion in enumerate(self.match_suggestions):
-            if (suggestion.id == match.id and
-                suggestion.bank_transaction.id == match.bank_transaction.id):
-                debug_log(f"  Found by ID+bank at index {i}")
-                return i
+        i = self._suggestion_index_by_id.get((match.id, bank_id))
+        if i is not None:
+            debug_log(f"  Found by ID+bank at index {i}")
+            return i
 
         # Fallback: try to find by bank transaction ID only
-        for i, suggestion in enumerate(self.match_suggestions):
-            if suggestion.bank_transaction.id == match.bank_transaction.id:
-                # Check if beacon entries also match
-                if len(suggestion.beacon_entries) == len(match.beacon_entries):
-                    beacon_ids_match = all(
-                        s.id == m.id
-                        for s, m in zip(suggestion.beacon_entries, match.beacon_entries)
-                    )
-                    if beacon_ids_match:
-                        debug_log(f"  Found by bank+beacons at index {i}")
-                        return i
+        for i in self._suggestion_index_by_bank.get(bank_id, ()):
+            suggestion = self.match_suggestions[i]
+            # Check if beacon entries also match
+            if len(suggestion.beacon_entries) == len(match.beacon_entries):
+                beacon_ids_match = all(
+                    s.id == m.id
+                    for s, m in zip(suggestion.beacon_entries, match.beacon_entries)
+                )
+                if beacon_ids_match:
+                    debug_log(f"  Found by bank+beacons at index {i}")
+                    return i
 
         debug_log(f"  NOT FOUND!")
         return -1
@@ -1533,10 +1795,7 @@ class ReconciliationSystem:
 
         Returns the BeaconEntry if found, None otherwise.
         """
-        for entry in self.beacon_entries:
-            if entry.trans_no == trans_no:
-                return entry
-        return None
+        return self._beacon_by_trans_no.get(trans_no)
 
     def is_beacon_already_matched(self, trans_no: str) -> bool:
         """Check if a beacon entry with the given trans_no is already matched."""
@@ -1558,7 +1817,11 @@ class ReconciliationSystem:
         """
         # Validate all trans_nos first
         beacon_entries = []
+        seen_trans_nos = set()
         for trans_no in trans_nos:
+            if trans_no in seen_trans_nos:
+                return (False, f"Trans_no '{trans_no}' is entered more than once", None)
+            seen_trans_nos.add(trans_no)
             entry = self.find_beacon_by_trans_no(trans_no)
             if entry is None:
                 return (False, f"Trans_no '{trans_no}' not found in beacon data", None)
@@ -1588,12 +1851,13 @@ class ReconciliationSystem:
         )
 
         # Mark beacon entries as matched
+        self.matched_beacon_ids.update(e.id for e in beacon_entries)
         for entry in beacon_entries:
             entry.matched = True
-            self.matched_beacon_ids.add(entry.id)
 
         # Add to confirmed matches
         self.confirmed_matches.append(match)
+        self._invalidate_matched_bank_index()
 
         # Save state
         self.save_state()
@@ -1625,12 +1889,28 @@ class ReconciliationSystem:
 
         # Add to confirmed matches
         self.confirmed_matches.append(match)
+        self._invalidate_matched_bank_index()
 
         # Save state
         self.save_state()
 
         return (True, "Bank transaction marked as manually resolved", match)
 
+    def _invalidate_matched_bank_index(self):
+        """Discard the cached bank_id -> match index after confirmed matches change."""
+        self._matched_bank_index = None
+
+    def _get_matched_bank_index(self) -> Dict[str, MatchSuggestion]:
+        """Get bank_id -> match for confirmed, manual and resolved matches (cached)."""
+        if self._matched_bank_index is None:
+            index = {}
+            for match in self.confirmed_matches:
+                if match.status in (MatchStatus.CONFIRMED, MatchStatus.MANUAL_MATCH,
+                                    MatchStatus.MANUALLY_RESOLVED):
+                    index[match.bank_transaction.id] = match
+            self._matched_bank_index = index
+        return self._matched_bank_index
+
     def get_all_bank_transactions_with_status(self) -> List[tuple]:
         """Get all bank transactions with their match status.
 
@@ -1639,31 +1919,21 @@ class ReconciliationSystem:
         - match is the MatchSuggestion if matched, else None
         """
         result = []
-
-        # Build lookup of bank transactions that have matches
-        matched_bank_ids = {}
-        for match in self.confirmed_matches:
-            if match.status in (MatchStatus.CONFIRMED, MatchStatus.MANUAL_MATCH,
-                               MatchStatus.MANUALLY_RESOLVED):
-                matched_bank_ids[match.bank_transaction.id] = match
+        matched_bank_ids = self._get_matched_bank_index()
 
         for bank_txn in self.bank_transactions:
-            if bank_txn.id in matched_bank_ids:
-                match = matched_bank_ids[bank_txn.id]
-                if match.status == MatchStatus.MANUAL_MATCH:
-                    result.append((bank_txn, 'manual_match', match))
-                elif match.status == MatchStatus.MANUALLY_RESOLVED:
-                    result.append((bank_txn, 'resolved', match))
-                else:
-                    result.append((bank_txn, 'matched', match))
-            else:
+            match = matched_bank_ids.get(bank_txn.id)
+            if match is None:
                 result.append((bank_txn, 'unmatched', None))
+            else:
+                result.append((bank_txn, _BANK_STATUS_LABELS.get(match.status, 'matched'), match))
 
         return result
 
     def get_unmatched_beacon_entries(self) -> List[BeaconEntry]:
         """Get all beacon entries that are not matched to any bank transaction."""
-        return [e for e in self.beacon_entries if e.id not in self.matched_beacon_ids]
+        matched_ids = self.matched_beacon_ids
+        return [e for e in self.beacon_entries if e.id not in matched_ids]
 
     def export_matched_csv(self, filepath: str) -> int:
         """Export matched bank transactions to CSV.
@@ -1673,10 +1943,9 @@ class ReconciliationSystem:
 
         Returns the number of rows written.
         """
-        import csv
-
         rows_written = 0
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8',
+                  buffering=_CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             # Header
             writer.writerow([
@@ -1685,53 +1954,55 @@ class ReconciliationSystem:
                 'beacon_mem_no', 'match_type', 'comment'
             ])
 
-            # Get all matched bank transactions in bank transaction order
-            for bank_txn, status, match in self.get_all_bank_transactions_with_status():
-                if status == 'unmatched':
-                    continue
-
-                if match.beacon_entries:
-                    # One row per beacon entry
-                    for beacon in match.beacon_entries:
-                        # Extract mem_no from beacon detail or payee if available
-                        mem_no = self._extract_mem_no_from_beacon(beacon)
-                        writer.writerow([
-                            bank_txn.id,
-                            bank_txn.date.strftime('%d/%m/%Y'),
-                            bank_txn.description,
-                            str(bank_txn.amount),
-                            beacon.trans_no,
-                            beacon.date.strftime('%d/%m/%Y'),
-                            beacon.payee,
-                            str(beacon.amount),
-                            mem_no,
-                            match.match_type,
-                            match.comment
-                        ])
-                        rows_written += 1
-                else:
-                    # Manually resolved - no beacon entries
-                    writer.writerow([
-                        bank_txn.id,
-                        bank_txn.date.strftime('%d/%m/%Y'),
-                        bank_txn.description,
-                        str(bank_txn.amount),
-                        '', '', '', '', '',  # Empty beacon fields
-                        match.match_type,
-                        match.comment
-                    ])
-                    rows_written += 1
+            for batch in _batched(self._matched_csv_rows(), _CSV_BATCH_SIZE):
+                writer.writerows(batch)
+                rows_written += len(batch)
 
         return rows_written
 
+    def _matched_csv_rows(self):
+        """Yield export_matched_csv rows in bank transaction order."""
+        extract_mem_no = self._extract_mem_no_from_beacon
+
+        # Get all matched bank transactions in bank transaction order
+        matched_bank_ids = self._get_matched_bank_index()
+        for bank_txn in self.bank_transactions:
+            match = matched_bank_ids.get(bank_txn.id)
+            if match is None:
+                continue
+
+            # Bank fields are the same for every row of this transaction
+            bank_fields = (
+                bank_txn.id,
+                bank_txn.formatted_date(),
+                bank_txn.description,
+                str(bank_txn.amount),
+            )
+            match_fields = (match.match_type, match.comment)
+
+            if match.beacon_entries:
+                # One row per beacon entry
+                for beacon in match.beacon_entries:
+                    # Extract mem_no from beacon detail or payee if available
+                    yield bank_fields + (
+                        beacon.trans_no,
+                        beacon.formatted_date(),
+                        beacon.payee,
+                        str(beacon.amount),
+                        extract_mem_no(beacon),
+                    ) + match_fields
+            else:
+                # Manually resolved - no beacon entries
+                yield bank_fields + ('', '', '', '', '') + match_fields  # Empty beacon fields
+
     def _extract_mem_no_from_beacon(self, beacon: BeaconEntry) -> str:
         """Extract member number from beacon entry if available."""
         # Try to extract from detail field
-        import re
         # Look for patterns like "member_1: 1234" or just numbers in detail
-        match = re.search(r'member_1[:\s]+(\d+)', beacon.detail, re.IGNORECASE)
-        if match:
-            return match.group(1)
+        if beacon.detail:
+            match = _MEM_NO_RE.search(beacon.detail)
+            if match:
+                return match.group(1)
 
         # Try raw_data if available
         if beacon.raw_data:
@@ -1746,37 +2017,29 @@ class ReconciliationSystem:
 
         Returns the number of rows written.
         """
-        import csv
-
         unmatched = self.get_unmatched_beacon_entries()
 
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8',
+                  buffering=_CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
+            extract_mem_no = self._extract_mem_no_from_beacon
             # Header
-            writer.writerow(['trans_no', 'date', 'payee', 'amount', 'mem_no', 'detail'])
-
-            for beacon in unmatched:
-                mem_no = self._extract_mem_no_from_beacon(beacon)
-                writer.writerow([
-                    beacon.trans_no,
-                    beacon.date.strftime('%d/%m/%Y'),
-                    beacon.payee,
-                    str(beacon.amount),
-                    mem_no,
-                    beacon.detail
-                ])
+            writer.writerow(('trans_no', 'date', 'payee', 'amount', 'mem_no', 'detail'))
+
+            writer.writerows((
+                beacon.trans_no,
+                beacon.formatted_date(),
+                beacon.payee,
+                str(beacon.amount),
+                extract_mem_no(beacon),
+                beacon.detail
+            ) for beacon in unmatched)
 
         return len(unmatched)
 
     def get_unmatched_bank_transactions(self) -> List[BankTransaction]:
         """Get all bank transactions that are not matched to any beacon entries."""
-        # Build set of matched bank transaction IDs
-        matched_bank_ids = set()
-        for match in self.confirmed_matches:
-            if match.status in (MatchStatus.CONFIRMED, MatchStatus.MANUAL_MATCH,
-                               MatchStatus.MANUALLY_RESOLVED):
-                matched_bank_ids.add(match.bank_transaction.id)
-
+        matched_bank_ids = self._get_matched_bank_index()
         return [b for b in self.bank_transactions if b.id not in matched_bank_ids]
 
     def export_unmatched_bank_csv(self, filepath: str) -> int:
@@ -1784,23 +2047,21 @@ class ReconciliationSystem:
 
         Returns the number of rows written.
         """
-        import csv
-
         unmatched = self.get_unmatched_bank_transactions()
 
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8',
+                  buffering=_CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             # Header
-            writer.writerow(['bank_id', 'date', 'type', 'description', 'amount'])
+            writer.writerow(('bank_id', 'date', 'type', 'description', 'amount'))
 
-            for bank in unmatched:
-                writer.writerow([
-                    bank.id,
-                    bank.date.strftime('%d/%m/%Y'),
-                    bank.type,
-                    bank.description,
-                    str(bank.amount)
-                ])
+            writer.writerows((
+                bank.id,
+                bank.formatted_date(),
+                bank.type,
+                bank.description,
+                str(bank.amount)
+            ) for bank in unmatched)
 
         return len(unmatched)
 
@@ -1821,14 +2082,13 @@ def main():
     print(f"Generated {len(suggestions)} match suggestions")
 
     # Count by status
-    confirmed = len([m for m in suggestions if m.status == MatchStatus.CONFIRMED])
-    pending = len([m for m in suggestions if m.status == MatchStatus.PENDING])
+    counts = Counter(m.status for m in suggestions)
 
-    print(f"  Auto-confirmed: {confirmed}")
-    print(f"  Pending review: {pending}")
+    print(f"  Auto-confirmed: {counts[MatchStatus.CONFIRMED]}")
+    print(f"  Pending review: {counts[MatchStatus.PENDING]}")
 
     # Print first few pending suggestions
-    pending_suggestions = [m for m in suggestions if m.status == MatchStatus.PENDING][:5]
+    pending_suggestions = list(islice((m for m in suggestions if m.status == MatchStatus.PENDING), 5))
     if pending_suggestions:
         print("\nFirst pending matches:")
         for match in pending_suggestions:
@@ -1,40 +1,94 @@
 """
 Test script for Bank Beacon Reconciliation System
 Tests all core functionality without GUI dependencies.
+
+Run directly (python test_reconciliation.py [--parallel]) or with pytest,
+which takes the shared system and suggestions from conftest.py.
 """
 
+import copy
+import io
 import os
+import subprocess
 import sys
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from decimal import Decimal
+from pathlib import Path
 
 from reconciliation_system import (
     ReconciliationSystem, MatchStatus, BankTransaction, BeaconEntry, MatchSuggestion
 )
 
 
-def test_loading():
-    """Test loading CSV files."""
-    print("\n=== Test: Loading Data ===")
+# Amounts used in the test assertions, parsed once
+_D6_50, _D9_50, _D13, _D26, _D45_50 = map(Decimal, ('6.50', '9.50', '13.00', '26.00', '45.50'))
+
+# Set TESTS_VERBOSE=1 to print the detail of each check (test banners and
+# results are always printed)
+VERBOSE = os.environ.get('TESTS_VERBOSE', '') not in ('', '0')
+
+
+def _log(*args, **kwargs):
+    """Print a test detail line (only when VERBOSE is enabled)."""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
+def _load_once():
+    """Parse the bank and beacon CSVs (without any saved state) for reuse by the tests."""
     system = ReconciliationSystem()
+    return system._load_bank_transactions(), system._load_beacon_entries()
+
+
+_BASE_BANK, _BASE_BEACON = _load_once()
+
+
+# Holds the state files of systems created without an explicit state_file
+# (removed when the test run exits)
+_STATE_DIR = tempfile.TemporaryDirectory(prefix="reconciliation_tests_")
+
+
+def _temp_state_file() -> str:
+    """Path of a new, not yet existing state file in its own temporary directory."""
+    return os.path.join(tempfile.mkdtemp(dir=_STATE_DIR.name), "reconciliation_state.json")
+
+
+def _new_system(**kwargs):
+    """Create and load a system from the CSV data parsed at import time.
+
+    Confirming a match sets BeaconEntry.matched, so each system gets deep
+    copies of the parsed entries. Unless a state_file is given, the system
+    gets a fresh temporary one, so tests never read or write the real
+    reconciliation_state.json.
+    """
+    kwargs.setdefault("state_file", _temp_state_file())
+    system = ReconciliationSystem(preloaded=copy.deepcopy((_BASE_BANK, _BASE_BEACON)), **kwargs)
     system.load_data()
+    return system
 
-    print(f"✓ Loaded {len(system.bank_transactions)} bank transactions")
-    print(f"✓ Loaded {len(system.beacon_entries)} beacon entries")
+
+def test_loading(system):
+    """Test loading CSV files (the system is loaded by the caller)."""
+    print("\n=== Test: Loading Data ===")
+
+    _log(f"✓ Loaded {len(system.bank_transactions)} bank transactions")
+    _log(f"✓ Loaded {len(system.beacon_entries)} beacon entries")
 
     assert len(system.bank_transactions) == 20, "Expected 20 bank transactions"
     assert len(system.beacon_entries) == 33, "Expected 33 beacon entries"
 
     print("✓ Loading test PASSED")
-    return system
 
 
-def test_one_to_one_matching(system):
+def test_one_to_one_matching(system, suggestions):
     """Test 1-to-1 matching detection."""
     print("\n=== Test: 1-to-1 Matching ===")
-    suggestions = system.generate_suggestions()
 
     one_to_one = [m for m in suggestions if m.match_type == "1-to-1"]
-    print(f"✓ Found {len(one_to_one)} 1-to-1 matches")
+    _log(f"✓ Found {len(one_to_one)} 1-to-1 matches")
 
     # Check specific expected 1-to-1 match (JONES A TRANSFER £13)
     jones_match = next(
@@ -45,26 +99,30 @@ def test_one_to_one_matching(system):
 
     assert jones_match is not None, "Expected JONES 1-to-1 match"
     assert len(jones_match.beacon_entries) == 1
-    assert jones_match.beacon_entries[0].amount == Decimal('13.00')
-    print(f"✓ JONES match found: £{jones_match.bank_transaction.amount} -> £{jones_match.beacon_entries[0].amount}")
+    assert jones_match.beacon_entries[0].amount == _D13
+    _log(f"✓ JONES match found: £{jones_match.bank_transaction.amount} -> £{jones_match.beacon_entries[0].amount}")
 
     print("✓ 1-to-1 matching test PASSED")
 
 
-def test_one_to_two_matching(system):
+def test_one_to_two_matching(system, suggestions):
     """Test 1-to-2 matching detection."""
     print("\n=== Test: 1-to-2 Matching ===")
-    suggestions = system.generate_suggestions()
 
     # Include both pending and auto-confirmed 1-to-2 matches
     one_to_two = [m for m in suggestions if m.match_type == "1-to-2"]
-    print(f"✓ Found {len(one_to_two)} 1-to-2 matches")
+    _log(f"✓ Found {len(one_to_two)} 1-to-2 matches")
+
+    # Index the 1-to-2 matches by the words of their bank descriptions
+    by_token = defaultdict(list)
+    for m in one_to_two:
+        for token in m.bank_transaction.description.split():
+            by_token[token].append(m)
 
     # Check SMITH J PAYMENT £26 = £13 + £13
     smith_match = next(
-        (m for m in one_to_two
-         if "SMITH" in m.bank_transaction.description and
-         m.bank_transaction.amount == Decimal('26.00')),
+        (m for m in by_token["SMITH"]
+         if m.bank_transaction.amount == _D26),
         None
     )
 
@@ -72,74 +130,125 @@ def test_one_to_two_matching(system):
     assert len(smith_match.beacon_entries) == 2
 
     beacon_total = sum(b.amount for b in smith_match.beacon_entries)
-    assert beacon_total == Decimal('26.00'), f"Expected sum £26, got £{beacon_total}"
-    print(f"✓ SMITH match found: £{smith_match.bank_transaction.amount} -> £{smith_match.beacon_entries[0].amount} + £{smith_match.beacon_entries[1].amount}")
+    assert beacon_total == _D26, f"Expected sum £26, got £{beacon_total}"
+    _log(f"✓ SMITH match found: £{smith_match.bank_transaction.amount} -> £{smith_match.beacon_entries[0].amount} + £{smith_match.beacon_entries[1].amount}")
 
     # Check uneven 1-to-2 match (TAYLOR £45.50 = £32 + £13.50)
     # This may be auto-confirmed due to high confidence
-    taylor_match = next(
-        (m for m in one_to_two
-         if "TAYLOR" in m.bank_transaction.description),
-        None
-    )
+    taylor_match = next(iter(by_token["TAYLOR"]), None)
 
     if taylor_match:
         beacon_total = sum(b.amount for b in taylor_match.beacon_entries)
-        assert beacon_total == Decimal('45.50')
-        print(f"✓ TAYLOR uneven match: £{taylor_match.bank_transaction.amount} -> £{taylor_match.beacon_entries[0].amount} + £{taylor_match.beacon_entries[1].amount} (status: {taylor_match.status.value})")
+        assert beacon_total == _D45_50
+        _log(f"✓ TAYLOR uneven match: £{taylor_match.bank_transaction.amount} -> £{taylor_match.beacon_entries[0].amount} + £{taylor_match.beacon_entries[1].amount} (status: {taylor_match.status.value})")
     else:
         # TAYLOR may have been auto-confirmed in a previous run
-        print("  (TAYLOR match may have been processed in previous state)")
+        _log("  (TAYLOR match may have been processed in previous state)")
 
     print("✓ 1-to-2 matching test PASSED")
 
 
-def test_common_amount_handling(system):
+def test_common_amount_handling(system, suggestions):
     """Test that common amounts (£13, £9.50, £6.50) have reduced confidence."""
     print("\n=== Test: Common Amount Handling ===")
 
     # Verify £6.50 is now a common amount
-    assert Decimal('6.50') in system.COMMON_AMOUNTS, "£6.50 should be a common amount"
-    assert Decimal('13.00') in system.COMMON_AMOUNTS, "£13.00 should be a common amount"
-    assert Decimal('9.50') in system.COMMON_AMOUNTS, "£9.50 should be a common amount"
-    print(f"✓ Common amounts: {[str(a) for a in system.COMMON_AMOUNTS]}")
-
-    suggestions = system.generate_suggestions()
-
-    # Find matches with common amounts (£13, £9.50, or £6.50)
-    common_amounts = [Decimal('13.00'), Decimal('9.50'), Decimal('6.50')]
-    common_matches = [
-        m for m in suggestions
-        if m.bank_transaction.amount in common_amounts
-        and m.match_type == "1-to-1"
-        and m.status == MatchStatus.PENDING  # Not auto-confirmed
-    ]
-
-    # Find matches with non-common amounts
-    non_common_matches = [
-        m for m in suggestions
-        if m.bank_transaction.amount not in common_amounts
-        and m.match_type == "1-to-1"
-    ]
+    assert _D6_50 in system.COMMON_AMOUNTS, "£6.50 should be a common amount"
+    assert _D13 in system.COMMON_AMOUNTS, "£13.00 should be a common amount"
+    assert _D9_50 in system.COMMON_AMOUNTS, "£9.50 should be a common amount"
+    _log(f"✓ Common amounts: {[str(a) for a in sorted(system.COMMON_AMOUNTS)]}")
+
+    # One pass over the 1-to-1 matches: confidence totals and counts for
+    # pending common amounts (£13, £9.50, or £6.50) and for non-common amounts
+    common_amounts = system.COMMON_AMOUNTS
+    common_sum = non_common_sum = 0.0
+    common_count = non_common_count = 0
+    for m in suggestions:
+        if m.match_type != "1-to-1":
+            continue
+        if m.bank_transaction.amount in common_amounts:
+            if m.status == MatchStatus.PENDING:  # Not auto-confirmed
+                common_sum += m.confidence_score
+                common_count += 1
+        else:
+            non_common_sum += m.confidence_score
+            non_common_count += 1
 
-    if common_matches and non_common_matches:
-        avg_common = sum(m.confidence_score for m in common_matches) / len(common_matches)
-        avg_non_common = sum(m.confidence_score for m in non_common_matches) / len(non_common_matches)
+    if common_count and non_common_count:
+        avg_common = common_sum / common_count
+        avg_non_common = non_common_sum / non_common_count
 
-        print(f"  Average confidence for common amounts: {avg_common:.2f}")
-        print(f"  Average confidence for non-common amounts: {avg_non_common:.2f}")
-        print("✓ Common amount weighting applied")
+        _log(f"  Average confidence for common amounts: {avg_common:.2f}")
+        _log(f"  Average confidence for non-common amounts: {avg_non_common:.2f}")
+        _log("✓ Common amount weighting applied")
 
     print("✓ Common amount handling test PASSED")
 
 
-def test_auto_confirmation(system):
+def test_name_scoring():
+    """Test surname comparison tiers used for name scoring."""
+    print("\n=== Test: Name Scoring ===")
+    system = ReconciliationSystem()
+
+    # Exact, truncated, substring and fuzzy surname matches
+    assert system._compare_surnames("jones", "jones") == 0.9
+    assert system._compare_surnames("abercromb", "abercrombie") == 0.85
+    assert system._compare_surnames("whittington", "whitington") > 0.6
+    # Short surnames need an exact match
+    assert system._compare_surnames("barry", "parry") == 0.0
+    _log("✓ Surname comparison tiers correct")
+
+    # Any surname in either order can match
+    assert system._calculate_name_score("KINNEAR MARGARET", "Ruth Kinnear") == 0.9
+    assert system._calculate_name_score("SMITH J PAYMENT", "Brown") == 0.0
+    _log("✓ Name scores correct")
+
+    print("✓ Name scoring test PASSED")
+
+
+def test_sub_penny_amounts_rejected():
+    """Test that sub-penny, infinite and out-of-range CSV amounts are skipped with a warning."""
+    print("\n=== Test: Sub-penny Amounts Rejected ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "Bank_Transactions.csv").write_text(
+            "Date,Type,Description,Amount\n"
+            "15-Jan-25,DEB,SMITH J PAYMENT,10.004\n"
+            "15-Jan-25,DEB,JONES A TRANSFER,10.00\n"
+            "15-Jan-25,DEB,BROWN B PAYMENT,Infinity\n"
+            "15-Jan-25,DEB,GREEN C PAYMENT,1e9999999\n",
+            encoding="utf-8"
+        )
+        Path(tmp, "Beacon_Entries.csv").write_text(
+            "trans_no,date,amount,payee,detail\n"
+            "TRN001,15/01/2025,10.001,J Smith,Payment\n"
+            "TRN002,15/01/2025,10.000,A Jones,Transfer\n"
+            "TRN003,15/01/2025,-Infinity,B Brown,Payment\n"
+            "TRN004,15/01/2025,1e9999999,C Green,Payment\n",
+            encoding="utf-8"
+        )
+        system = ReconciliationSystem(base_dir=tmp)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            system.load_data()
+
+    assert [b.description for b in system.bank_transactions] == ["JONES A TRANSFER"]
+    assert [e.trans_no for e in system.beacon_entries] == ["TRN002"]
+    warnings = output.getvalue()
+    assert "not a whole number of pence" in warnings
+    assert "is not a finite number" in warnings
+    assert "is out of range" in warnings
+    assert warnings.count("Could not parse") == 6
+    _log("✓ Sub-penny, infinite and huge amounts skipped with a warning; 10.00 and 10.000 loaded")
+
+    print("✓ Sub-penny amounts test PASSED")
+
+
+def test_auto_confirmation():
     """Test auto-confirmation of high-confidence matches."""
     print("\n=== Test: Auto-Confirmation ===")
 
-    # Reset system
-    system = ReconciliationSystem()
-    system.load_data()
+    system = _new_system()
     suggestions = system.generate_suggestions()
 
     # Verify no auto-confirmation happened yet (disabled by default)
@@ -153,8 +262,8 @@ def test_auto_confirmation(system):
     auto_confirmed = [m for m in suggestions if m.status == MatchStatus.CONFIRMED]
     pending = [m for m in suggestions if m.status == MatchStatus.PENDING]
 
-    print(f"  Auto-confirmed: {len(auto_confirmed)}")
-    print(f"  Pending: {len(pending)}")
+    _log(f"  Auto-confirmed: {len(auto_confirmed)}")
+    _log(f"  Pending: {len(pending)}")
 
     # Verify thresholds are being applied
     for match in auto_confirmed:
@@ -164,112 +273,216 @@ def test_auto_confirmation(system):
         else:
             assert match.confidence_score > 0.80, f"Other amount auto-confirmed below 80%: {match.confidence_score}"
 
-    print("✓ All auto-confirmed matches meet threshold requirements")
+    _log("✓ All auto-confirmed matches meet threshold requirements")
     print("✓ Auto-confirmation test PASSED")
 
 
-def test_match_status_changes(system):
+def test_match_status_changes(system, suggestions):
     """Test confirming, rejecting, and changing match decisions."""
     print("\n=== Test: Match Status Changes ===")
 
-    suggestions = system.generate_suggestions()
     test_match = suggestions[0]
 
     # Initial status should be PENDING
     assert test_match.status == MatchStatus.PENDING
-    print(f"✓ Initial status: {test_match.status.value}")
+    _log(f"✓ Initial status: {test_match.status.value}")
 
     # Confirm the match
     system.confirm_match(test_match)
     assert test_match.status == MatchStatus.CONFIRMED
-    print(f"✓ After confirm: {test_match.status.value}")
+    _log(f"✓ After confirm: {test_match.status.value}")
 
     # Check beacon entries are marked as matched
-    for beacon in test_match.beacon_entries:
-        assert beacon.id in system.matched_beacon_ids
-    print(f"✓ {len(test_match.beacon_entries)} beacon entries marked as matched")
+    match_beacon_ids = {b.id for b in test_match.beacon_entries}
+    assert match_beacon_ids <= system.matched_beacon_ids
+    _log(f"✓ {len(test_match.beacon_entries)} beacon entries marked as matched")
 
     # Undo confirmation
     system.undo_confirmation(test_match)
     assert test_match.status == MatchStatus.PENDING
-    print(f"✓ After undo: {test_match.status.value}")
+    _log(f"✓ After undo: {test_match.status.value}")
 
     # Check beacon entries are unmarked
-    for beacon in test_match.beacon_entries:
-        assert beacon.id not in system.matched_beacon_ids
-    print("✓ Beacon entries unmarked")
+    assert match_beacon_ids.isdisjoint(system.matched_beacon_ids)
+    _log("✓ Beacon entries unmarked")
 
     # Test reject
     system.reject_match(test_match)
     assert test_match.status == MatchStatus.REJECTED
-    print(f"✓ After reject: {test_match.status.value}")
+    _log(f"✓ After reject: {test_match.status.value}")
 
     # Test update_match_status
     system.update_match_status(test_match, MatchStatus.CONFIRMED)
     assert test_match.status == MatchStatus.CONFIRMED
-    print(f"✓ After update to CONFIRMED: {test_match.status.value}")
+    _log(f"✓ After update to CONFIRMED: {test_match.status.value}")
 
     # Change from CONFIRMED to SKIPPED
     system.update_match_status(test_match, MatchStatus.SKIPPED)
     assert test_match.status == MatchStatus.SKIPPED
     # Beacon entries should be unmarked when changing from CONFIRMED
-    for beacon in test_match.beacon_entries:
-        assert beacon.id not in system.matched_beacon_ids
-    print(f"✓ After update to SKIPPED: {test_match.status.value} (beacons unmarked)")
+    assert match_beacon_ids.isdisjoint(system.matched_beacon_ids)
+    _log(f"✓ After update to SKIPPED: {test_match.status.value} (beacons unmarked)")
 
     print("✓ Match status changes test PASSED")
 
 
+def test_confirm_rejects_conflicting_matches():
+    """Test that confirming a match rejects pending matches sharing its bank or beacons."""
+    print("\n=== Test: Confirm Rejects Conflicting Matches ===")
+
+    system = _new_system()
+    suggestions = system.generate_suggestions()
+
+    # Pick a match whose bank transaction or beacons appear in other suggestions
+    match = next(
+        m for m in suggestions
+        if m.beacon_entries and any(
+            other is not m and (
+                other.bank_transaction.id == m.bank_transaction.id or
+                {b.id for b in other.beacon_entries} & {b.id for b in m.beacon_entries}
+            )
+            for other in suggestions
+        )
+    )
+    beacon_ids = {b.id for b in match.beacon_entries}
+    system.confirm_match(match)
+
+    conflicting = [
+        m for m in suggestions
+        if m is not match and (
+            m.bank_transaction.id == match.bank_transaction.id or
+            beacon_ids & {b.id for b in m.beacon_entries}
+        )
+    ]
+    for m in conflicting:
+        assert m.status == MatchStatus.REJECTED, f"{m.id} should be rejected, got {m.status.value}"
+        assert m in system.rejected_matches
+
+    _log(f"✓ {len(conflicting)} conflicting matches rejected after confirming {match.id}")
+    print("✓ Confirm rejects conflicting matches test PASSED")
+
+
+# Confirms every pending suggestion and prints the resulting rejected_matches order
+_REJECTION_ORDER_SCRIPT = """
+import os, tempfile
+from reconciliation_system import ReconciliationSystem, MatchStatus
+with tempfile.TemporaryDirectory() as tmp:
+    system = ReconciliationSystem(state_file=os.path.join(tmp, "state.json"))
+    system.load_data()
+    for match in list(system.generate_suggestions()):
+        if match.status == MatchStatus.PENDING:
+            system.confirm_match(match)
+    print([m.id for m in system.rejected_matches])
+"""
+
+
+def test_rejection_order_deterministic():
+    """Test that auto-rejected matches are recorded in the same order whatever the hash seed."""
+    print("\n=== Test: Rejection Order Is Deterministic ===")
+
+    orders = set()
+    for seed in ("1", "2", "3"):
+        result = subprocess.run(
+            [sys.executable, "-c", _REJECTION_ORDER_SCRIPT],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True, text=True, check=True
+        )
+        orders.add(result.stdout)
+
+    assert len(orders) == 1, f"rejected_matches order depends on the hash seed: {orders}"
+    _log("✓ Same rejected_matches order under 3 hash seeds")
+    print("✓ Rejection order test PASSED")
+
+
+def test_check_consistency():
+    """Test detection of shared beacons and amount mismatches in confirmed matches."""
+    print("\n=== Test: Consistency Check ===")
+
+    system = _new_system()
+    suggestions = system.generate_suggestions()
+
+    # A freshly confirmed match is consistent
+    match = next(m for m in suggestions if m.beacon_entries)
+    system.confirm_match(match)
+    assert system.check_consistency() == []
+    _log("✓ No inconsistencies after a normal confirmation")
+
+    # Confirm a second match for another bank transaction reusing the same beacon
+    other_bank = next(b for b in system.bank_transactions
+                      if b.id != match.bank_transaction.id and b.amount != match.beacon_entries[0].amount)
+    duplicate = MatchSuggestion(
+        id="MATCH_9999",
+        bank_transaction=other_bank,
+        beacon_entries=[match.beacon_entries[0]],
+        confidence_score=0.5,
+        match_type="1-to-1",
+        status=MatchStatus.CONFIRMED
+    )
+    system.confirmed_matches.append(duplicate)
+
+    progress = []
+    inconsistencies = system.check_consistency(lambda current, total, message: progress.append((current, total)))
+    reasons = [reason for _, reason, _ in inconsistencies]
+
+    assert len(inconsistencies) == 2, f"Expected 2 inconsistencies, got {reasons}"
+    assert any("confirmed in multiple matches" in r for r in reasons)
+    assert any(r.startswith("Amount mismatch") for r in reasons)
+    shared = next(related for _, reason, related in inconsistencies if "multiple" in reason)
+    assert {m.id for m in shared} == {match.id, duplicate.id}
+    assert progress and progress[-1][0] == progress[-1][1], "Progress should reach completion"
+    _log(f"✓ Found {len(inconsistencies)} inconsistencies: shared beacon and amount mismatch")
+
+    print("✓ Consistency check test PASSED")
+
+
 def test_navigation_simulation():
     """Simulate GUI navigation behavior."""
     print("\n=== Test: Navigation Simulation ===")
 
-    system = ReconciliationSystem()
-    system.load_data()
+    system = _new_system()
     suggestions = system.generate_suggestions()
 
     current_index = 0
     queued_changes = {}  # Simulates GUI queue
 
     # Move forward and make decisions
-    print("  Navigating forward and making decisions...")
+    _log("  Navigating forward and making decisions...")
 
     # Confirm first match
     match = suggestions[current_index]
     queued_changes[match.id] = MatchStatus.CONFIRMED
     current_index += 1
-    print(f"  Index {current_index-1}: Queued CONFIRMED for {match.id}")
+    _log(f"  Index {current_index-1}: Queued CONFIRMED for {match.id}")
 
     # Reject second match
     match = suggestions[current_index]
     queued_changes[match.id] = MatchStatus.REJECTED
     current_index += 1
-    print(f"  Index {current_index-1}: Queued REJECTED for {match.id}")
+    _log(f"  Index {current_index-1}: Queued REJECTED for {match.id}")
 
     # Skip third match
     match = suggestions[current_index]
     queued_changes[match.id] = MatchStatus.SKIPPED
     current_index += 1
-    print(f"  Index {current_index-1}: Queued SKIPPED for {match.id}")
+    _log(f"  Index {current_index-1}: Queued SKIPPED for {match.id}")
 
     # Navigate back
     current_index -= 2
-    print(f"  Navigated back to index {current_index}")
+    _log(f"  Navigated back to index {current_index}")
 
     # Change previous decision
     match = suggestions[current_index]
     old_status = queued_changes.get(match.id, MatchStatus.PENDING)
     queued_changes[match.id] = MatchStatus.CONFIRMED
-    print(f"  Changed {match.id} from {old_status.value} to CONFIRMED")
+    _log(f"  Changed {match.id} from {old_status.value} to CONFIRMED")
 
     # Apply queued changes
-    print("  Applying queued changes...")
+    _log("  Applying queued changes...")
+    by_id = {m.id: m for m in suggestions}
     for match_id, new_status in queued_changes.items():
-        for m in suggestions:
-            if m.id == match_id:
-                system.update_match_status(m, new_status)
-                print(f"  Applied {new_status.value} to {match_id}")
-                break
+        system.update_match_status(by_id[match_id], new_status)
+        _log(f"  Applied {new_status.value} to {match_id}")
 
     # Verify final states
     assert suggestions[0].status == MatchStatus.CONFIRMED
@@ -279,13 +492,11 @@ def test_navigation_simulation():
     print("✓ Navigation simulation test PASSED")
 
 
-def test_beacon_exclusivity(system):
+def test_beacon_exclusivity():
     """Test that Beacon entries can only match one Bank transaction."""
     print("\n=== Test: Beacon Exclusivity ===")
 
-    # Reset system
-    system = ReconciliationSystem()
-    system.load_data()
+    system = _new_system()
     suggestions = system.generate_suggestions()
 
     # Confirm a match
@@ -293,40 +504,39 @@ def test_beacon_exclusivity(system):
     beacon_ids = [b.id for b in match.beacon_entries]
     system.confirm_match(match)
 
-    print(f"✓ Confirmed match with beacon IDs: {beacon_ids}")
+    _log(f"✓ Confirmed match with beacon IDs: {beacon_ids}")
 
     # Regenerate suggestions
     new_suggestions = system.generate_suggestions()
 
     # Check that matched beacon IDs are not used in new suggestions
-    for new_match in new_suggestions:
-        for beacon in new_match.beacon_entries:
-            assert beacon.id not in beacon_ids, f"Beacon {beacon.id} should be excluded"
+    new_beacon_ids = {b.id for m in new_suggestions for b in m.beacon_entries}
+    reused = new_beacon_ids.intersection(beacon_ids)
+    assert not reused, f"Beacons {sorted(reused)} should be excluded"
 
-    print("✓ Confirmed beacon entries excluded from new suggestions")
+    _log("✓ Confirmed beacon entries excluded from new suggestions")
     print("✓ Beacon exclusivity test PASSED")
 
 
-def test_date_tolerance():
+def test_date_tolerance(system, suggestions):
     """Test that matches outside date tolerance are excluded."""
     print("\n=== Test: Date Tolerance ===")
 
-    system = ReconciliationSystem()
-    system.load_data()
-    suggestions = system.generate_suggestions()
-
     # Asymmetric tolerance: beacon after bank allows up to 63 days (9 weeks)
     # beacon before bank only allows 2 days
-    for match in suggestions:
-        bank_date = match.bank_transaction.date
-        for beacon in match.beacon_entries:
-            days_diff = (beacon.date - bank_date).days  # positive = beacon after bank
-            if days_diff >= 0:
-                assert days_diff <= 63, f"Match {match.id} has date diff of {days_diff} days (max 63)"
-            else:
-                assert abs(days_diff) <= 2, f"Match {match.id} has beacon {abs(days_diff)} days before bank (max 2)"
-
-    print("✓ All matches within date tolerance (up to 9 weeks for beacon after bank)")
+    # (days_diff, match_id) per beacon; positive = beacon after bank
+    days_diffs = [
+        (beacon.date_ord - match.bank_transaction.date_ord, match.id)
+        for match in suggestions
+        for beacon in match.beacon_entries
+    ]
+    if days_diffs:
+        latest, latest_id = max(days_diffs)
+        earliest, earliest_id = min(days_diffs)
+        assert latest <= 63, f"Match {latest_id} has date diff of {latest} days (max 63)"
+        assert earliest >= -2, f"Match {earliest_id} has beacon {-earliest} days before bank (max 2)"
+
+    _log("✓ All matches within date tolerance (up to 9 weeks for beacon after bank)")
     print("✓ Date tolerance test PASSED")
 
 
@@ -334,15 +544,14 @@ def test_state_persistence():
     """Test saving and loading state."""
     print("\n=== Test: State Persistence ===")
 
-    # Create system with a separate test state file
-    test_state_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_state.json")
+    # Create system with a separate test state file (pickled; the other
+    # persistence tests cover the JSON format)
+    test_state_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_state.pkl")
 
     # Remove test state file if exists
-    if os.path.exists(test_state_file):
-        os.remove(test_state_file)
+    Path(test_state_file).unlink(missing_ok=True)
 
-    system = ReconciliationSystem(state_file=test_state_file)
-    system.load_data()
+    system = _new_system(state_file=test_state_file)
     suggestions = system.generate_suggestions()
 
     # Count how many were auto-confirmed
@@ -357,31 +566,95 @@ def test_state_persistence():
     system.save_state()
     final_confirmed = len(system.confirmed_matches)
 
-    print(f"✓ Saved state with {final_confirmed} confirmed matches (auto: {initial_confirmed}, manual: {final_confirmed - initial_confirmed})")
+    _log(f"✓ Saved state with {final_confirmed} confirmed matches (auto: {initial_confirmed}, manual: {final_confirmed - initial_confirmed})")
 
     # Create new system, load state
-    system2 = ReconciliationSystem(state_file=test_state_file)
-    system2.load_data()
+    system2 = _new_system(state_file=test_state_file)
     system2._load_state()
 
     assert len(system2.confirmed_matches) == final_confirmed, f"Expected {final_confirmed}, got {len(system2.confirmed_matches)}"
     assert len(system2.matched_beacon_ids) >= initial_beacon_ids
 
-    print(f"✓ Loaded state with {len(system2.confirmed_matches)} confirmed matches")
-    print(f"✓ {len(system2.matched_beacon_ids)} beacon IDs marked as matched")
+    _log(f"✓ Loaded state with {len(system2.confirmed_matches)} confirmed matches")
+    _log(f"✓ {len(system2.matched_beacon_ids)} beacon IDs marked as matched")
 
     # Cleanup
-    if os.path.exists(test_state_file):
-        os.remove(test_state_file)
+    Path(test_state_file).unlink(missing_ok=True)
     print("✓ State persistence test PASSED")
 
 
+def test_bank_status_tracking():
+    """Test that bank transaction status follows confirm, undo and manual resolution."""
+    print("\n=== Test: Bank Status Tracking ===")
+
+    system = _new_system(state_file=_temp_state_file())
+    suggestions = system.generate_suggestions()
+
+    def status_of(bank_id):
+        return next(status for bank, status, _ in system.get_all_bank_transactions_with_status()
+                    if bank.id == bank_id)
+
+    assert len(system.get_unmatched_bank_transactions()) == len(system.bank_transactions)
+
+    match = next(m for m in suggestions if m.beacon_entries)
+    bank_id = match.bank_transaction.id
+    system.confirm_match(match)
+    assert status_of(bank_id) == 'matched'
+    assert bank_id not in {b.id for b in system.get_unmatched_bank_transactions()}
+    _log(f"✓ {bank_id} is matched after confirm")
+
+    system.update_match_status(match, MatchStatus.SKIPPED)
+    assert status_of(bank_id) == 'unmatched'
+    assert bank_id in {b.id for b in system.get_unmatched_bank_transactions()}
+    _log(f"✓ {bank_id} is unmatched after undo")
+
+    system.create_manually_resolved(match.bank_transaction, "Paid in cash")
+    assert status_of(bank_id) == 'resolved'
+    _log(f"✓ {bank_id} is resolved after manual resolution")
+
+    print("✓ Bank status tracking test PASSED")
+
+
+def test_manual_match():
+    """Test creating manual matches and rejecting invalid trans_nos."""
+    print("\n=== Test: Manual Match ===")
+
+    system = _new_system(state_file=_temp_state_file())
+
+    bank_txn = system.bank_transactions[0]
+    beacon = next(e for e in system.beacon_entries if e.amount * 2 == bank_txn.amount)
+
+    # The same trans_no twice must not count the beacon entry twice
+    success, message, match = system.create_manual_match(bank_txn, [beacon.trans_no, beacon.trans_no])
+    assert not success and match is None, "Duplicate trans_no should be rejected"
+    assert beacon.id not in system.matched_beacon_ids
+    _log(f"✓ Duplicate trans_no rejected: {message}")
+
+    success, message, match = system.create_manual_match(bank_txn, ["NO_SUCH_TRANS_NO"])
+    assert not success
+    _log(f"✓ Unknown trans_no rejected: {message}")
+
+    success, message, match = system.create_manual_match(bank_txn, [beacon.trans_no])
+    assert not success and "Amount mismatch" in message
+    _log(f"✓ Amount mismatch rejected: {message}")
+
+    other = next(e for e in system.beacon_entries
+                 if e.id != beacon.id and beacon.amount + e.amount == bank_txn.amount)
+    success, message, match = system.create_manual_match(bank_txn, [beacon.trans_no, other.trans_no])
+    assert success, message
+    assert match.status == MatchStatus.MANUAL_MATCH
+    assert {beacon.id, other.id} <= system.matched_beacon_ids
+    assert system.is_beacon_already_matched(beacon.trans_no)
+    _log(f"✓ {message}")
+
+    print("✓ Manual match test PASSED")
+
+
 def test_export():
     """Test exporting results to CSV."""
     print("\n=== Test: Export Results ===")
 
-    system = ReconciliationSystem()
-    system.load_data()
+    system = _new_system()
     suggestions = system.generate_suggestions()
 
     # Make some decisions
@@ -395,14 +668,15 @@ def test_export():
     assert os.path.exists("test_results.csv")
 
     # Read and check content
-    with open("test_results.csv", 'r') as f:
-        lines = f.readlines()
+    with open("test_results.csv", 'r', encoding='utf-8') as f:
+        row_count = f.read().count('\n')
 
-    assert len(lines) >= 21  # Header + at least 20 matches (may have more due to multiple matches per bank txn)
-    print(f"✓ Exported {len(lines)-1} matches to CSV")
+    assert row_count >= 21  # Header + at least 20 matches (may have more due to multiple matches per bank txn)
+    assert row_count == len(system.match_suggestions) + 1, "Expected one row per suggestion plus header"
+    _log(f"✓ Exported {row_count-1} matches to CSV")
 
     # Cleanup
-    os.remove("test_results.csv")
+    Path("test_results.csv").unlink()
     print("✓ Export test PASSED")
 
 
@@ -414,11 +688,9 @@ def test_rejected_persistence():
     test_state_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_rejected_state.json")
 
     # Remove test state file if exists
-    if os.path.exists(test_state_file):
-        os.remove(test_state_file)
+    Path(test_state_file).unlink(missing_ok=True)
 
-    system = ReconciliationSystem(state_file=test_state_file)
-    system.load_data()
+    system = _new_system(state_file=test_state_file)
     suggestions = system.generate_suggestions()
 
     # Find a pending match and reject it
@@ -431,71 +703,100 @@ def test_rejected_persistence():
 
     assert test_match.status == MatchStatus.REJECTED
     assert rejected_bank_id in system.rejected_bank_ids
-    print(f"✓ Rejected match for bank ID: {rejected_bank_id}")
+    _log(f"✓ Rejected match for bank ID: {rejected_bank_id}")
 
     system.save_state()
-    print("✓ Saved state with rejected match")
+    _log("✓ Saved state with rejected match")
 
     # Create new system, load state
-    system2 = ReconciliationSystem(state_file=test_state_file)
-    system2.load_data()
+    system2 = _new_system(state_file=test_state_file)
 
     # Check rejected bank IDs are loaded
     assert rejected_bank_id in system2.rejected_bank_ids, "Rejected bank ID not loaded"
-    print("✓ Rejected bank ID restored from state")
+    _log("✓ Rejected bank ID restored from state")
 
     # Generate suggestions - should restore rejected status
     suggestions2 = system2.generate_suggestions()
 
-    # Find the match with the rejected bank ID
-    restored_match = next(
-        (m for m in suggestions2 if m.bank_transaction.id == rejected_bank_id),
-        None
-    )
+    # Find the first match with the rejected bank ID
+    by_bank = {}
+    for m in suggestions2:
+        by_bank.setdefault(m.bank_transaction.id, m)
+    restored_match = by_bank.get(rejected_bank_id)
     assert restored_match is not None, "Rejected match not found in new suggestions"
     assert restored_match.status == MatchStatus.REJECTED, f"Expected REJECTED, got {restored_match.status.value}"
-    print("✓ Rejected status restored in regenerated suggestions")
+    _log("✓ Rejected status restored in regenerated suggestions")
 
     # Test undo rejection
     system2.undo_rejection(restored_match)
     assert restored_match.status == MatchStatus.PENDING
     assert rejected_bank_id not in system2.rejected_bank_ids
-    print("✓ Undo rejection works correctly")
+    _log("✓ Undo rejection works correctly")
 
     # Cleanup
-    if os.path.exists(test_state_file):
-        os.remove(test_state_file)
+    Path(test_state_file).unlink(missing_ok=True)
     print("✓ Rejected match persistence test PASSED")
 
 
-def run_all_tests():
-    """Run all tests."""
+# Tests that build their own systems and use their own state/export files,
+# so they can run in any order or in separate processes
+INDEPENDENT_TESTS = (
+    test_name_scoring,
+    test_sub_penny_amounts_rejected,
+    test_auto_confirmation,
+    test_confirm_rejects_conflicting_matches,
+    test_rejection_order_deterministic,
+    test_check_consistency,
+    test_navigation_simulation,
+    test_beacon_exclusivity,
+    test_state_persistence,
+    test_rejected_persistence,
+    test_bank_status_tracking,
+    test_manual_match,
+    test_export,
+)
+
+
+def _run_captured(test):
+    """Run a test in a worker process and return its printed output."""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        test()
+    return output.getvalue()
+
+
+def run_all_tests(parallel=False):
+    """Run all tests.
+
+    With parallel=True (--parallel on the command line) the independent tests
+    run in a process pool; their output is printed in order once each finishes.
+    """
     print("=" * 60)
     print("Bank Beacon Reconciliation System - Test Suite")
     print("=" * 60)
 
-    # Clean up any existing state file to ensure fresh tests
-    state_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reconciliation_state.json")
-    if os.path.exists(state_file):
-        os.remove(state_file)
-        print("(Removed existing state file for clean test run)")
-
-    system = test_loading()
-    test_one_to_one_matching(system)
-    test_one_to_two_matching(system)
-    test_common_amount_handling(system)
-    test_auto_confirmation(system)
-    test_match_status_changes(system)
-    test_navigation_simulation()
-    test_beacon_exclusivity(system)
-    test_date_tolerance()
-    test_state_persistence()
-    test_rejected_persistence()
-    test_export()
-
-    # Clean up state file after tests
-    if os.path.exists(state_file):
-        os.remove(state_file)
+    # A fresh temporary state file, as the conftest system fixture uses
+    system = ReconciliationSystem(state_file=_temp_state_file())
+    system.load_data()
+    test_loading(system)
+    # Generate once and share (as a tuple, so the tests see a fixed snapshot
+    # even though the system re-sorts its own list in place);
+    # test_match_status_changes mutates suggestions[0] so it runs after the
+    # read-only matching tests
+    suggestions = tuple(system.generate_suggestions())
+    test_one_to_one_matching(system, suggestions)
+    test_one_to_two_matching(system, suggestions)
+    test_common_amount_handling(system, suggestions)
+    test_date_tolerance(system, suggestions)
+    test_match_status_changes(system, suggestions)
+
+    if parallel:
+        with ProcessPoolExecutor() as pool:
+            for output in pool.map(_run_captured, INDEPENDENT_TESTS):
+                print(output, end="")
+    else:
+        for test in INDEPENDENT_TESTS:
+            test()
 
     print("\n" + "=" * 60)
     print("ALL TESTS PASSED!")
@@ -503,4 +804,4 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    run_all_tests()
+    run_all_tests(parallel="--parallel" in sys.argv[1:])
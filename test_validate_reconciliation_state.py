@@ -0,0 +1,340 @@
+"""
+Test script for validate_reconciliation_state.py
+
+Run directly (python test_validate_reconciliation_state.py) or with pytest.
+"""
+
+import copy
+import io
+import json
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import validate_reconciliation_state
+from validate_reconciliation_state import ReconciliationStateValidator
+
+
+def _match(match_id: str, **overrides) -> dict:
+    """A valid confirmed 1-to-1 match as saved in the state file."""
+    match = {
+        "id": match_id,
+        "bank_transaction": {
+            "id": "BANK_0001",
+            "date": "15-Jan-25",
+            "type": "DEB",
+            "description": "SMITH J PAYMENT",
+            "amount": "13.00"
+        },
+        "beacon_entries": [{
+            "id": "BEACON_0001",
+            "date": "15/01/2025",
+            "trans_no": "TRN001",
+            "payee": "J Smith",
+            "amount": "13.00",
+            "detail": "Payment",
+            "matched": True
+        }],
+        "confidence_score": 1.0,
+        "match_type": "1-to-1",
+        "status": "confirmed",
+        "amount_score": 1.0,
+        "date_score": 1.0,
+        "name_score": 0.9,
+        "comment": ""
+    }
+    match.update(overrides)
+    return match
+
+
+def _state(confirmed: list, rejected: list = (), matched_beacon_ids: list = None) -> dict:
+    """A state file holding the given matches (matched_beacon_ids from confirmed by default)."""
+    if matched_beacon_ids is None:
+        matched_beacon_ids = [b["id"] for m in confirmed for b in m["beacon_entries"]]
+    return {
+        "matched_beacon_ids": matched_beacon_ids,
+        "confirmed_matches": list(confirmed),
+        "rejected_bank_ids": [],
+        "rejected_matches": list(rejected)
+    }
+
+
+def _load(contents, **kwargs) -> tuple[ReconciliationStateValidator, bool]:
+    """Write contents (a state dict, or raw text) to a temporary file and load it.
+
+    Returns the validator and the result of load().
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "reconciliation_state.json"
+        path.write_text(contents if isinstance(contents, str) else json.dumps(contents), encoding="utf-8")
+        validator = ReconciliationStateValidator(str(path), **kwargs)
+        loaded = validator.load()
+    return validator, loaded
+
+
+def _duplicate_error_types(first: dict, second: dict) -> list:
+    """Validate two matches sharing an ID and return the duplicate error types reported."""
+    validator, loaded = _load(_state([first, second]))
+    assert loaded
+    return [e.error_type for e in validator.validate() if e.error_type.startswith("DUPLICATE_ID")]
+
+
+def test_duplicate_scalars_compared_by_type():
+    """Test that duplicates differing only by true/1 or 1/1.0 are reported as DIFFERENT."""
+    print("\n=== Test: Duplicate Scalars Compared By Type ===")
+
+    one = _match("MATCH_0001", amount_score=1)
+    assert _duplicate_error_types(one, _match("MATCH_0001", amount_score=True)) == ["DUPLICATE_ID_DIFFERENT"]
+    assert _duplicate_error_types(one, _match("MATCH_0001", amount_score=1.0)) == ["DUPLICATE_ID_DIFFERENT"]
+    assert _duplicate_error_types(one, copy.deepcopy(one)) == ["DUPLICATE_ID_IDENTICAL"]
+
+    print("✓ Duplicate scalar type test PASSED")
+
+
+def test_duplicate_differences_compared_by_type():
+    """Test that fields differing only by true/1 or 1/1.0 are listed as differences."""
+    print("\n=== Test: Duplicate Differences Compared By Type ===")
+
+    first = _match("MATCH_0001", amount_score=1, date_score=1)
+    second = _match("MATCH_0001", amount_score=True, date_score=1.0, comment="")
+    validator, loaded = _load(_state([first, second]))
+    assert loaded
+    error = next(e for e in validator.validate() if e.error_type == "DUPLICATE_ID_DIFFERENT")
+    assert len(error.details["differences"]) == 1
+    listed = error.details["differences"][0].split("differ in fields: ")[1].split(", ")
+    assert sorted(listed) == ["amount_score", "date_score"], listed
+
+    print("✓ Duplicate differences type test PASSED")
+
+
+def test_duplicate_ids_identical_and_different():
+    """Test that duplicate IDs are reported as IDENTICAL or DIFFERENT, with their locations."""
+    print("\n=== Test: Duplicate IDs Identical And Different ===")
+
+    identical = _match("MATCH_0001")
+    # Same data with the keys in another order, in rejected_matches
+    reordered = dict(reversed(list(copy.deepcopy(identical).items())))
+    different = _match("MATCH_0002")
+    changed = _match("MATCH_0002", comment="Paid twice")
+
+    validator, loaded = _load(_state([identical, different, changed], rejected=[reordered]))
+    assert loaded
+    errors = [e for e in validator.validate() if e.error_type.startswith("DUPLICATE_ID")]
+
+    assert [e.error_type for e in errors] == ["DUPLICATE_ID_IDENTICAL", "DUPLICATE_ID_DIFFERENT"]
+    assert errors[0].details["occurrences"] == ["confirmed_matches[0]", "rejected_matches[0]"]
+    assert errors[1].details["occurrences"] == ["confirmed_matches[1]", "confirmed_matches[2]"]
+    assert errors[1].details["differences"] == ["Occurrence 0 vs 1: differ in fields: comment"]
+
+    print("✓ Duplicate IDs test PASSED")
+
+
+def test_load_rejects_non_object():
+    """Test that a state file whose top level is not a JSON object fails to load."""
+    print("\n=== Test: Load Rejects Non-object ===")
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        validator, loaded = _load("[]")
+    assert not loaded
+    assert validator.data is None
+    assert "Expected a JSON object at the top level, found list" in output.getvalue()
+    assert validator.validate() == []
+
+    print("✓ Non-object load test PASSED")
+
+
+def test_load_without_orjson():
+    """Test that load() parses with the json module when orjson is not installed."""
+    print("\n=== Test: Load Without orjson ===")
+
+    state = _state([_match("MATCH_0001")])
+    nan_state = json.dumps(state).replace('"confidence_score": 1.0', '"confidence_score": NaN')
+    saved_orjson = validate_reconciliation_state.orjson
+    validate_reconciliation_state.orjson = None
+    try:
+        validator, loaded = _load(state)
+        assert loaded
+        assert validator.data == state
+        assert validator.validate() == []
+
+        # NaN is accepted by the json module
+        validator, loaded = _load(nan_state)
+        assert loaded
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            validator, loaded = _load('{"confirmed_matches": [}')
+        assert not loaded
+        assert "Invalid JSON syntax at line 1, column 24" in output.getvalue()
+    finally:
+        validate_reconciliation_state.orjson = saved_orjson
+
+    # With orjson installed, what it rejects (like NaN) falls back to json
+    if saved_orjson is not None:
+        validator, loaded = _load(nan_state)
+        assert loaded
+
+    print("✓ Load without orjson test PASSED")
+
+
+def test_orphans_capped_per_check():
+    """Test that max_errors_per_check lists the first orphans and only counts the rest."""
+    print("\n=== Test: Orphans Capped Per Check ===")
+
+    orphans = [f"BEACON_{n:04d}" for n in (9, 3, 7, 5, 8)]
+    state = _state([_match("MATCH_0001")], matched_beacon_ids=["BEACON_0001"] + orphans)
+
+    validator, loaded = _load(state, max_errors_per_check=2)
+    assert loaded
+    errors = validator.validate()
+    assert [e.details["beacon_id"] for e in errors] == ["BEACON_0003", "BEACON_0005"]
+    assert validator.omitted == {"ORPHANED_BEACON_ID": 3}
+
+    report = validator.generate_report()
+    assert "SUMMARY: Found 2 error(s)" in report
+    assert "Plus 3 more not listed (at most 2 per check)" in report
+    assert "  - ORPHANED_BEACON_ID: 2 (+3 not listed)" in report
+
+    # Without a cap every orphan is listed and nothing is omitted
+    validator, loaded = _load(state)
+    assert len(validator.validate()) == 5
+    assert validator.omitted == {}
+
+    # The cap is also available on the command line
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "state.json").write_text(json.dumps(state), encoding="utf-8")
+        result = subprocess.run(
+            [sys.executable, validate_reconciliation_state.__file__, "state.json", "--max-errors-per-check", "2"],
+            cwd=tmp, capture_output=True, text=True
+        )
+    assert result.returncode == 1
+    assert "Validation FAILED with 2 error(s) listed and 3 more not listed" in result.stdout
+
+    print("✓ Orphan cap test PASSED")
+
+
+def _state_with_each_error() -> dict:
+    """A state with one duplicate ID, orphaned beacon ID, wrong status and matched-flag error."""
+    bad_flag = _match("MATCH_0002", status="pending")
+    bad_flag["beacon_entries"][0].update(id="BEACON_0002", matched=False)
+    return _state([_match("MATCH_0001"), _match("MATCH_0001", comment="Café"), bad_flag],
+                  matched_beacon_ids=["BEACON_0001", "BEACON_0002", "BEACON_0099"])
+
+
+def _error_fields(errors) -> list:
+    """Comparable (type, message, location, suggestion, details) tuples for a list of errors."""
+    return [(e.error_type, e.message, e.location, e.suggestion, e.details) for e in errors]
+
+
+def _report_body(validator) -> str:
+    """The text report without its File: and Generated: lines (temporary path and time)."""
+    return "\n".join(line for line in validator.generate_report().split("\n")
+                     if not line.startswith(("File:", "Generated:")))
+
+
+def test_report_jsonl():
+    """Test that the JSON Lines report has one parseable object per error."""
+    print("\n=== Test: JSON Lines Report ===")
+
+    validator, loaded = _load(_state_with_each_error())
+    assert loaded
+    errors = validator.validate()
+    output = io.BytesIO()
+    count = validator.generate_report_jsonl(output)
+
+    lines = output.getvalue().decode("utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert count == len(records) == len(errors) == 4
+    assert [r["type"] for r in records] == [
+        "DUPLICATE_ID_DIFFERENT", "ORPHANED_BEACON_ID", "WRONG_STATUS", "INCONSISTENT_MATCHED_FLAG"
+    ]
+    for record, error in zip(records, errors):
+        assert set(record) == {"type", "message", "location", "suggestion", "details"}
+        assert record["message"] == error.message
+        assert record["location"] == error.location
+        assert record["suggestion"] == error.suggestion
+        assert record["details"] == error.details
+
+    # Streaming from iter_errors() gives the same bytes, with or without orjson
+    saved_orjson = validate_reconciliation_state.orjson
+    validate_reconciliation_state.orjson = None
+    try:
+        streamed = io.BytesIO()
+        assert validator.generate_report_jsonl(streamed, validator.iter_errors()) == count
+    finally:
+        validate_reconciliation_state.orjson = saved_orjson
+    assert streamed.getvalue() == output.getvalue()
+
+    print("✓ JSON Lines report test PASSED")
+
+
+def test_parallel_scan_matches_sequential():
+    """Test that the threaded checks give the same errors, omitted counts and report as sequential."""
+    print("\n=== Test: Parallel Scan Matches Sequential ===")
+
+    pools = []
+
+    class RecordingExecutor(validate_reconciliation_state.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    state = _state_with_each_error()
+    saved_executor = validate_reconciliation_state.ThreadPoolExecutor
+    validate_reconciliation_state.ThreadPoolExecutor = RecordingExecutor
+    try:
+        for cap in (None, 0):
+            sequential, loaded = _load(state, max_errors_per_check=cap)
+            assert loaded
+            expected = _error_fields(sequential.validate())
+            assert not sequential._use_parallel_scan()
+
+            parallel, loaded = _load(state, max_errors_per_check=cap)
+            assert loaded
+            # The real gate needs a free-threaded build and a large file
+            parallel._use_parallel_scan = lambda: True
+            used_before = len(pools)
+            assert _error_fields(parallel.validate()) == expected
+            assert len(pools) == used_before + 1, "threaded branch did not run"
+
+            assert parallel.omitted == sequential.omitted
+            assert _report_body(parallel) == _report_body(sequential)
+            assert _error_fields(parallel.iter_errors()) == expected
+    finally:
+        validate_reconciliation_state.ThreadPoolExecutor = saved_executor
+
+    assert sequential.omitted == {"ORPHANED_BEACON_ID": 1}
+    print("✓ Parallel scan test PASSED")
+
+
+ALL_TESTS = (
+    test_duplicate_scalars_compared_by_type,
+    test_duplicate_differences_compared_by_type,
+    test_duplicate_ids_identical_and_different,
+    test_load_rejects_non_object,
+    test_load_without_orjson,
+    test_orphans_capped_per_check,
+    test_report_jsonl,
+    test_parallel_scan_matches_sequential,
+)
+
+
+def run_all_tests():
+    """Run all validator tests."""
+    print("=" * 60)
+    print("Reconciliation State Validator - Test Suite")
+    print("=" * 60)
+
+    for test in ALL_TESTS:
+        test()
+
+    print("\n" + "=" * 60)
+    print("ALL TESTS PASSED!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -8,17 +8,57 @@ Checks for:
 3. Wrong Status in confirmed_matches (should only be confirmed, manual_match, or manually_resolved)
 4. Inconsistent matched flag (beacon entries in confirmed_matches should have matched=true)
 
-Usage: python validate_reconciliation_state.py [path_to_json_file]
+Usage: python validate_reconciliation_state.py [path_to_json_file] [--format text|jsonl]
+                                              [--max-errors-per-check N]
        If no path provided, looks for reconciliation_state.json in current directory
 
 Output: Console output + validation_report.txt in current directory
+        With --format jsonl: validation_report.jsonl (one JSON object per error)
+        in current directory, and only a summary on the console
+
+Requires only the standard library (orjson is used if installed). The
+checks are plain dict/list traversals with nothing CPython-specific, so
+very large state files can also be validated with PyPy.
 """
 
+import argparse
+import heapq
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+try:
+    import orjson  # Optional: faster parsing of large state files
+except ImportError:
+    orjson = None
+
+# Write buffer size for the report file (one large write for big reports)
+_REPORT_BUFFER_SIZE = 1 << 20
+
+# Run the duplicate-ID check and the confirmed_matches scan on two threads when
+# the interpreter is free-threaded (no GIL) and the file has at least this many
+# matches; with the GIL, threads would only add overhead
+_PARALLEL_MIN_MATCHES = 50_000
+
+
+def _freeze(value):
+    """Convert parsed JSON into a hashable value that compares equal exactly when the JSON does.
+
+    Dicts become frozensets of (key, value) pairs (so key order is irrelevant)
+    and lists become tuples. Scalars are tagged with their type, because Python
+    treats true == 1 == 1.0 as equal although the JSON differs; floats are
+    compared by repr, as json.dumps writes them (so NaN equals NaN).
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if type(value) is float:
+        return (float, repr(value))
+    return (type(value), value)
 
 
 class ValidationError:
@@ -38,19 +78,36 @@ class ValidationError:
 class ReconciliationStateValidator:
     """Validates reconciliation_state.json files."""
 
-    VALID_CONFIRMED_STATUSES = {"confirmed", "manual_match", "manually_resolved"}
-
-    def __init__(self, file_path: str):
+    VALID_CONFIRMED_STATUSES = frozenset({"confirmed", "manual_match", "manually_resolved"})
+    # Sorted forms used in WRONG_STATUS errors (built once, shared by all errors)
+    _VALID_STATUSES_SORTED = tuple(sorted(VALID_CONFIRMED_STATUSES))
+    _VALID_STATUSES_STR = ', '.join(_VALID_STATUSES_SORTED)
+    # Header lines of each error in the detailed report
+    _ERROR_TEMPLATE = (
+        "Error #{0}: [{error.error_type}]\n"
+        "  Message: {error.message}\n"
+        "  Location: {error.location}\n"
+        "  Suggestion: {error.suggestion}"
+    )
+
+    def __init__(self, file_path: str, max_errors_per_check: int | None = None):
         self.file_path = Path(file_path)
+        # Optional cap on errors reported by checks that can produce one per ID
+        # (currently orphaned beacon IDs); the rest are only counted, in omitted
+        self.max_errors_per_check = max_errors_per_check
         self.data = None
+        # The three top-level arrays, looked up once by load()
+        self._confirmed: list = []
+        self._rejected: list = []
+        self._matched_ids: list = []
         self.errors: list[ValidationError] = []
+        # Number of errors of each type found but not reported (see max_errors_per_check)
+        self.omitted: dict[str, int] = {}
 
     def load(self) -> bool:
         """Load the JSON file. Returns True if successful."""
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
-            return True
+            data = self._parse_json(self.file_path.read_bytes())
         except FileNotFoundError:
             print(f"ERROR: File not found: {self.file_path}")
             return False
@@ -58,106 +115,191 @@ class ReconciliationStateValidator:
             print(f"ERROR: Invalid JSON syntax at line {e.lineno}, column {e.colno}: {e.msg}")
             return False
 
+        if not isinstance(data, dict):
+            print(f"ERROR: Expected a JSON object at the top level, found {type(data).__name__}")
+            return False
+
+        self.data = data
+        self._confirmed = data.get("confirmed_matches") or []
+        self._rejected = data.get("rejected_matches") or []
+        self._matched_ids = data.get("matched_beacon_ids") or []
+        self._intern_strings()
+        return True
+
+    @staticmethod
+    def _parse_json(raw: bytes):
+        """Parse the file contents, using orjson when it is installed.
+
+        orjson is stricter than the json module (it rejects NaN, for example),
+        so anything it rejects is parsed again with json - which also provides
+        the error details reported for invalid files.
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(raw.decode('utf-8'))
+
+    def _intern_strings(self):
+        """Intern the match IDs, statuses and beacon IDs the checks hash and compare.
+
+        Equal strings then share one object, so set and dict lookups on them
+        usually succeed on the identity check without comparing characters.
+        """
+        intern = sys.intern
+
+        for matches in (self._confirmed, self._rejected):
+            for match in matches:
+                if not isinstance(match, dict):
+                    continue
+                for field in ("id", "status"):
+                    value = match.get(field)
+                    if type(value) is str:
+                        match[field] = intern(value)
+                for beacon in match.get("beacon_entries") or []:
+                    if isinstance(beacon, dict) and type(beacon.get("id")) is str:
+                        beacon["id"] = intern(beacon["id"])
+
+        if isinstance(self._matched_ids, list):
+            self._matched_ids[:] = [
+                intern(beacon_id) if type(beacon_id) is str else beacon_id
+                for beacon_id in self._matched_ids
+            ]
+
     def validate(self) -> list[ValidationError]:
         """Run all validation checks. Returns list of errors."""
-        self.errors = []
-
-        if self.data is None:
-            return self.errors
+        self.errors = list(self.iter_errors())
+        return self.errors
 
-        self._check_duplicate_match_ids()
-        self._check_orphaned_beacon_ids()
-        self._check_wrong_status_in_confirmed()
-        self._check_inconsistent_matched_flag()
+    def iter_errors(self):
+        """Yield validation errors one at a time, in report order.
 
-        return self.errors
+        Unlike validate(), this does not store the errors, so callers that only
+        need the first few (or a count) never build the full list. Errors left
+        out by max_errors_per_check are counted in self.omitted once the
+        iteration finishes.
+        """
+        self.omitted = {}
+        if self.data is None:
+            return
+
+        if self._use_parallel_scan():
+            # Both passes only read the data; results are merged in check order
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                duplicates = pool.submit(lambda: list(self._check_duplicate_match_ids()))
+                scan = pool.submit(self._scan_confirmed_matches)
+                duplicate_errors = duplicates.result()
+                confirmed_beacon_ids, status_errors, matched_flag_errors = scan.result()
+            yield from duplicate_errors
+        else:
+            yield from self._check_duplicate_match_ids()
+
+            # The remaining checks share one pass over confirmed_matches; errors
+            # are still reported in check order (orphans, status, matched flag)
+            confirmed_beacon_ids, status_errors, matched_flag_errors = self._scan_confirmed_matches()
+
+        yield from self._check_orphaned_beacon_ids(confirmed_beacon_ids)
+        yield from status_errors
+        yield from matched_flag_errors
+
+    def _use_parallel_scan(self) -> bool:
+        """True if the checks should run on threads (free-threaded Python and a large file)."""
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        return not gil_enabled and len(self._confirmed) + len(self._rejected) >= _PARALLEL_MIN_MATCHES
 
     def _check_duplicate_match_ids(self):
         """Check for duplicate Match IDs across confirmed_matches and rejected_matches."""
-        id_occurrences = defaultdict(list)
-
-        # Collect all match IDs with their source and full data
-        for idx, match in enumerate(self.data.get("confirmed_matches", [])):
-            match_id = match.get("id", f"<missing_id_at_index_{idx}>")
-            id_occurrences[match_id].append({
-                "source": "confirmed_matches",
-                "index": idx,
-                "data": match
-            })
-
-        for idx, match in enumerate(self.data.get("rejected_matches", [])):
-            match_id = match.get("id", f"<missing_id_at_index_{idx}>")
-            id_occurrences[match_id].append({
-                "source": "rejected_matches",
-                "index": idx,
-                "data": match
-            })
-
-        # Find duplicates
-        for match_id, occurrences in id_occurrences.items():
-            if len(occurrences) > 1:
-                # Check if data is identical or different
-                first_data = occurrences[0]["data"]
-                all_identical = all(
-                    self._compare_matches(first_data, occ["data"])
-                    for occ in occurrences[1:]
+        sources = (("confirmed_matches", self._confirmed), ("rejected_matches", self._rejected))
+
+        # First pass: every ID, in order, built in one comprehension; a single
+        # set() of them is enough to tell whether any ID repeats
+        ids = [
+            match["id"] if "id" in match else f"<missing_id_at_index_{idx}>"
+            for _, matches in sources
+            for idx, match in enumerate(matches)
+        ]
+        if len(set(ids)) == len(ids):
+            return
+
+        duplicate_ids = {match_id for match_id, count in Counter(ids).items() if count > 1}
+
+        # Second pass: collect source and full data for the duplicated IDs only
+        # (dict order is each ID's first appearance, as reported). matches is
+        # zipped first so zip stops without consuming the next list's first ID.
+        id_iter = iter(ids)
+        duplicates = {}
+        for source, matches in sources:
+            for idx, (match, match_id) in enumerate(zip(matches, id_iter)):
+                if match_id in duplicate_ids:
+                    duplicates.setdefault(match_id, []).append({
+                        "source": source,
+                        "index": idx,
+                        "data": match
+                    })
+
+        for match_id, occurrences in duplicates.items():
+            # Check if data is identical or different (signatures are
+            # hashable, so identical data collapses to a single entry)
+            all_identical = len({self._match_signature(occ["data"]) for occ in occurrences}) == 1
+
+            locations = [f"{occ['source']}[{occ['index']}]" for occ in occurrences]
+
+            if all_identical:
+                yield ValidationError(
+                    error_type="DUPLICATE_ID_IDENTICAL",
+                    message=f"Match ID '{match_id}' appears {len(occurrences)} times with IDENTICAL data",
+                    location=", ".join(locations),
+                    suggestion=f"Remove all but one occurrence of '{match_id}'. Since data is identical, keep any one and delete the others.",
+                    details={
+                        "match_id": match_id,
+                        "count": len(occurrences),
+                        "occurrences": locations,
+                        "data_identical": True
+                    }
+                )
+            else:
+                # Find differences between occurrences
+                differences = self._describe_differences(occurrences)
+                yield ValidationError(
+                    error_type="DUPLICATE_ID_DIFFERENT",
+                    message=f"Match ID '{match_id}' appears {len(occurrences)} times with DIFFERENT data",
+                    location=", ".join(locations),
+                    suggestion=f"Renumber duplicate IDs to make them unique. Assign new sequential IDs (e.g., MATCH_NNNN where NNNN is max existing + 1, +2, etc.)",
+                    details={
+                        "match_id": match_id,
+                        "count": len(occurrences),
+                        "occurrences": locations,
+                        "data_identical": False,
+                        "differences": differences
+                    }
                 )
 
-                locations = [f"{occ['source']}[{occ['index']}]" for occ in occurrences]
-
-                if all_identical:
-                    self.errors.append(ValidationError(
-                        error_type="DUPLICATE_ID_IDENTICAL",
-                        message=f"Match ID '{match_id}' appears {len(occurrences)} times with IDENTICAL data",
-                        location=", ".join(locations),
-                        suggestion=f"Remove all but one occurrence of '{match_id}'. Since data is identical, keep any one and delete the others.",
-                        details={
-                            "match_id": match_id,
-                            "count": len(occurrences),
-                            "occurrences": locations,
-                            "data_identical": True
-                        }
-                    ))
-                else:
-                    # Find differences between occurrences
-                    differences = self._describe_differences(occurrences)
-                    self.errors.append(ValidationError(
-                        error_type="DUPLICATE_ID_DIFFERENT",
-                        message=f"Match ID '{match_id}' appears {len(occurrences)} times with DIFFERENT data",
-                        location=", ".join(locations),
-                        suggestion=f"Renumber duplicate IDs to make them unique. Assign new sequential IDs (e.g., MATCH_NNNN where NNNN is max existing + 1, +2, etc.)",
-                        details={
-                            "match_id": match_id,
-                            "count": len(occurrences),
-                            "occurrences": locations,
-                            "data_identical": False,
-                            "differences": differences
-                        }
-                    ))
+    @staticmethod
+    def _match_signature(match: dict) -> frozenset:
+        """Hashable form of the match data without the id field, for comparing duplicates.
 
-    def _compare_matches(self, match1: dict, match2: dict) -> bool:
-        """Compare two match objects for equality (ignoring id field)."""
-        # Create copies without the id field for comparison
-        m1 = {k: v for k, v in match1.items() if k != "id"}
-        m2 = {k: v for k, v in match2.items() if k != "id"}
-        return json.dumps(m1, sort_keys=True) == json.dumps(m2, sort_keys=True)
+        Signatures compare structurally (nested dicts and lists by value,
+        key order is irrelevant, scalars by type as well as value).
+        """
+        return frozenset((k, _freeze(v)) for k, v in match.items() if k != "id")
 
     def _describe_differences(self, occurrences: list[dict]) -> list[str]:
         """Describe the differences between duplicate occurrences."""
         differences = []
         first = occurrences[0]["data"]
+        first_keys = set(first)
 
         for i, occ in enumerate(occurrences[1:], start=1):
             other = occ["data"]
             diff_fields = []
 
-            all_keys = set(first.keys()) | set(other.keys())
+            all_keys = first_keys.union(other)
             for key in all_keys:
                 if key == "id":
                     continue
-                val1 = first.get(key)
-                val2 = other.get(key)
-                if json.dumps(val1, sort_keys=True) != json.dumps(val2, sort_keys=True):
+                # Compared as frozen values, so true vs 1 or 1 vs 1.0 is a difference
+                if _freeze(first.get(key)) != _freeze(other.get(key)):
                     diff_fields.append(key)
 
             if diff_fields:
@@ -165,23 +307,55 @@ class ReconciliationStateValidator:
 
         return differences
 
-    def _check_orphaned_beacon_ids(self):
-        """Check that every ID in matched_beacon_ids has a corresponding beacon entry in confirmed_matches."""
-        matched_beacon_ids = set(self.data.get("matched_beacon_ids", []))
+    def _scan_confirmed_matches(self) -> tuple[set, list[ValidationError], list[ValidationError]]:
+        """Scan confirmed_matches once for the orphan, status and matched-flag checks.
 
-        # Collect all beacon IDs actually present in confirmed_matches
+        Returns (beacon IDs present in confirmed_matches, WRONG_STATUS errors,
+        INCONSISTENT_MATCHED_FLAG errors).
+        """
         confirmed_beacon_ids = set()
-        for match in self.data.get("confirmed_matches", []):
-            for beacon in match.get("beacon_entries", []):
+        status_errors = []
+        matched_flag_errors = []
+
+        for match_idx, match in enumerate(self._confirmed):
+            match_id = match.get("id", f"<no_id_at_index_{match_idx}>")
+
+            # Check that confirmed_matches only contains entries with valid statuses
+            status = match.get("status", "<missing>")
+            if status not in self.VALID_CONFIRMED_STATUSES:
+                status_errors.append(self._wrong_status_error(match_idx, match_id, status))
+
+            for beacon_idx, beacon in enumerate(match.get("beacon_entries", [])):
+                # Collect the beacon IDs actually present in confirmed_matches
                 beacon_id = beacon.get("id")
                 if beacon_id:
                     confirmed_beacon_ids.add(beacon_id)
 
+                # Check that the beacon entry has matched=true
+                matched_flag = beacon.get("matched")
+                if matched_flag is not True:
+                    matched_flag_errors.append(self._matched_flag_error(
+                        match_idx, match_id, beacon_idx, beacon.get("id", "<no_id>"), matched_flag
+                    ))
+
+        return confirmed_beacon_ids, status_errors, matched_flag_errors
+
+    def _check_orphaned_beacon_ids(self, confirmed_beacon_ids: set):
+        """Check that every ID in matched_beacon_ids has a corresponding beacon entry in confirmed_matches."""
+        matched_beacon_ids = set(self._matched_ids)
+
         # Find orphans
         orphaned = matched_beacon_ids - confirmed_beacon_ids
 
-        for orphan_id in sorted(orphaned):
-            self.errors.append(ValidationError(
+        limit = self.max_errors_per_check
+        if limit is not None and len(orphaned) > limit:
+            # Only the first `limit` IDs are reported, so select them without sorting all
+            reported = heapq.nsmallest(limit, orphaned)
+        else:
+            reported = sorted(orphaned)
+
+        for orphan_id in reported:
+            yield ValidationError(
                 error_type="ORPHANED_BEACON_ID",
                 message=f"Beacon ID '{orphan_id}' is in matched_beacon_ids but has no corresponding entry in confirmed_matches",
                 location=f"matched_beacon_ids (contains '{orphan_id}')",
@@ -189,178 +363,218 @@ class ReconciliationStateValidator:
                 details={
                     "beacon_id": orphan_id
                 }
-            ))
-
-    def _check_wrong_status_in_confirmed(self):
-        """Check that confirmed_matches only contains entries with valid statuses."""
-        for idx, match in enumerate(self.data.get("confirmed_matches", [])):
-            status = match.get("status", "<missing>")
-            match_id = match.get("id", f"<no_id_at_index_{idx}>")
-
-            if status not in self.VALID_CONFIRMED_STATUSES:
-                self.errors.append(ValidationError(
-                    error_type="WRONG_STATUS",
-                    message=f"Match '{match_id}' has invalid status '{status}' in confirmed_matches",
-                    location=f"confirmed_matches[{idx}] (id: {match_id})",
-                    suggestion=f"Move this entry to rejected_matches if status is 'rejected', or remove it if status is 'pending' or 'skipped'. Valid statuses for confirmed_matches are: {', '.join(sorted(self.VALID_CONFIRMED_STATUSES))}",
-                    details={
-                        "match_id": match_id,
-                        "index": idx,
-                        "current_status": status,
-                        "valid_statuses": list(self.VALID_CONFIRMED_STATUSES)
-                    }
-                ))
-
-    def _check_inconsistent_matched_flag(self):
-        """Check that all beacon entries in confirmed_matches have matched=true."""
-        for match_idx, match in enumerate(self.data.get("confirmed_matches", [])):
-            match_id = match.get("id", f"<no_id_at_index_{match_idx}>")
-
-            for beacon_idx, beacon in enumerate(match.get("beacon_entries", [])):
-                beacon_id = beacon.get("id", f"<no_id>")
-                matched_flag = beacon.get("matched")
-
-                if matched_flag is not True:
-                    self.errors.append(ValidationError(
-                        error_type="INCONSISTENT_MATCHED_FLAG",
-                        message=f"Beacon entry '{beacon_id}' in confirmed match '{match_id}' has matched={matched_flag} (should be true)",
-                        location=f"confirmed_matches[{match_idx}].beacon_entries[{beacon_idx}] (beacon_id: {beacon_id})",
-                        suggestion=f"Change 'matched' to true for beacon entry '{beacon_id}' in match '{match_id}'",
-                        details={
-                            "match_id": match_id,
-                            "match_index": match_idx,
-                            "beacon_id": beacon_id,
-                            "beacon_index": beacon_idx,
-                            "current_value": matched_flag
-                        }
-                    ))
+            )
+
+        if len(reported) < len(orphaned):
+            self.omitted["ORPHANED_BEACON_ID"] = len(orphaned) - len(reported)
+
+    def _wrong_status_error(self, idx: int, match_id: str, status: str) -> ValidationError:
+        """Error for a confirmed_matches entry whose status is not a confirmed status."""
+        return ValidationError(
+            error_type="WRONG_STATUS",
+            message=f"Match '{match_id}' has invalid status '{status}' in confirmed_matches",
+            location=f"confirmed_matches[{idx}] (id: {match_id})",
+            suggestion=f"Move this entry to rejected_matches if status is 'rejected', or remove it if status is 'pending' or 'skipped'. Valid statuses for confirmed_matches are: {self._VALID_STATUSES_STR}",
+            details={
+                "match_id": match_id,
+                "index": idx,
+                "current_status": status,
+                "valid_statuses": list(self._VALID_STATUSES_SORTED)
+            }
+        )
+
+    @staticmethod
+    def _matched_flag_error(match_idx: int, match_id: str, beacon_idx: int,
+                            beacon_id: str, matched_flag) -> ValidationError:
+        """Error for a beacon entry in confirmed_matches that does not have matched=true."""
+        return ValidationError(
+            error_type="INCONSISTENT_MATCHED_FLAG",
+            message=f"Beacon entry '{beacon_id}' in confirmed match '{match_id}' has matched={matched_flag} (should be true)",
+            location=f"confirmed_matches[{match_idx}].beacon_entries[{beacon_idx}] (beacon_id: {beacon_id})",
+            suggestion=f"Change 'matched' to true for beacon entry '{beacon_id}' in match '{match_id}'",
+            details={
+                "match_id": match_id,
+                "match_index": match_idx,
+                "beacon_id": beacon_id,
+                "beacon_index": beacon_idx,
+                "current_value": matched_flag
+            }
+        )
 
     def generate_report(self) -> str:
         """Generate a formatted report of all validation errors."""
-        lines = []
-        lines.append("=" * 80)
-        lines.append("RECONCILIATION STATE VALIDATION REPORT")
-        lines.append(f"File: {self.file_path}")
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("=" * 80)
-        lines.append("")
-
-        if not self.errors:
-            lines.append("No validation errors found. The file appears to be valid.")
-            lines.append("")
-            return "\n".join(lines)
+        return "\n".join(self._iter_report_lines())
+
+    def _iter_report_lines(self):
+        """Yield the lines of the report (an error's block is yielded as one string)."""
+        yield "=" * 80
+        yield "RECONCILIATION STATE VALIDATION REPORT"
+        yield f"File: {self.file_path}"
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield "=" * 80
+        yield ""
+
+        if not self.errors and not self.omitted:
+            yield "No validation errors found. The file appears to be valid."
+            yield ""
+            return
 
         # Summary
-        lines.append(f"SUMMARY: Found {len(self.errors)} error(s)")
-        lines.append("")
+        yield f"SUMMARY: Found {len(self.errors)} error(s)"
+        if self.omitted:
+            yield (f"  Plus {sum(self.omitted.values())} more not listed "
+                   f"(at most {self.max_errors_per_check} per check)")
+        yield ""
 
         # Group errors by type
         errors_by_type = defaultdict(list)
         for error in self.errors:
             errors_by_type[error.error_type].append(error)
 
-        lines.append("Errors by type:")
-        for error_type, type_errors in sorted(errors_by_type.items()):
-            lines.append(f"  - {error_type}: {len(type_errors)}")
-        lines.append("")
+        yield "Errors by type:"
+        for error_type in sorted(errors_by_type.keys() | self.omitted.keys()):
+            omitted = self.omitted.get(error_type)
+            if omitted:
+                yield f"  - {error_type}: {len(errors_by_type[error_type])} (+{omitted} not listed)"
+            else:
+                yield f"  - {error_type}: {len(errors_by_type[error_type])}"
+        yield ""
 
         # Detailed errors
-        lines.append("-" * 80)
-        lines.append("DETAILED ERRORS")
-        lines.append("-" * 80)
-        lines.append("")
+        yield "-" * 80
+        yield "DETAILED ERRORS"
+        yield "-" * 80
+        yield ""
 
         for i, error in enumerate(self.errors, start=1):
-            lines.append(f"Error #{i}: [{error.error_type}]")
-            lines.append(f"  Message: {error.message}")
-            lines.append(f"  Location: {error.location}")
-            lines.append(f"  Suggestion: {error.suggestion}")
+            yield self._ERROR_TEMPLATE.format(i, error=error)
 
             # Add extra details for duplicate ID errors
             if error.error_type in ("DUPLICATE_ID_IDENTICAL", "DUPLICATE_ID_DIFFERENT"):
                 if "differences" in error.details and error.details["differences"]:
-                    lines.append("  Differences:")
+                    yield "  Differences:"
                     for diff in error.details["differences"]:
-                        lines.append(f"    - {diff}")
+                        yield f"    - {diff}"
 
-            lines.append("")
+            yield ""
 
         # Fix instructions
-        lines.append("-" * 80)
-        lines.append("HOW TO FIX THESE ERRORS")
-        lines.append("-" * 80)
-        lines.append("")
+        yield "-" * 80
+        yield "HOW TO FIX THESE ERRORS"
+        yield "-" * 80
+        yield ""
 
         if "DUPLICATE_ID_IDENTICAL" in errors_by_type:
-            lines.append("DUPLICATE_ID_IDENTICAL:")
-            lines.append("  These are exact duplicate entries. Simply delete all but one copy.")
-            lines.append("  Search for the match ID in your JSON file and remove duplicate objects.")
-            lines.append("")
+            yield "DUPLICATE_ID_IDENTICAL:"
+            yield "  These are exact duplicate entries. Simply delete all but one copy."
+            yield "  Search for the match ID in your JSON file and remove duplicate objects."
+            yield ""
 
         if "DUPLICATE_ID_DIFFERENT" in errors_by_type:
-            lines.append("DUPLICATE_ID_DIFFERENT:")
-            lines.append("  These entries have the same ID but different data.")
-            lines.append("  1. Find the highest MATCH_NNNN ID in your file")
-            lines.append("  2. Renumber the duplicate entries with new sequential IDs")
-            lines.append("  3. Example: if max ID is MATCH_0150, rename duplicates to MATCH_0151, MATCH_0152, etc.")
-            lines.append("")
-
-        if "ORPHANED_BEACON_ID" in errors_by_type:
-            lines.append("ORPHANED_BEACON_ID:")
-            lines.append("  These beacon IDs are marked as matched but have no confirmed match.")
-            lines.append("  Option A: Remove the orphaned ID from the 'matched_beacon_ids' array")
-            lines.append("  Option B: Restore/add the missing confirmed match that references this beacon")
-            lines.append("")
+            yield "DUPLICATE_ID_DIFFERENT:"
+            yield "  These entries have the same ID but different data."
+            yield "  1. Find the highest MATCH_NNNN ID in your file"
+            yield "  2. Renumber the duplicate entries with new sequential IDs"
+            yield "  3. Example: if max ID is MATCH_0150, rename duplicates to MATCH_0151, MATCH_0152, etc."
+            yield ""
+
+        if "ORPHANED_BEACON_ID" in errors_by_type or "ORPHANED_BEACON_ID" in self.omitted:
+            yield "ORPHANED_BEACON_ID:"
+            yield "  These beacon IDs are marked as matched but have no confirmed match."
+            yield "  Option A: Remove the orphaned ID from the 'matched_beacon_ids' array"
+            yield "  Option B: Restore/add the missing confirmed match that references this beacon"
+            if "ORPHANED_BEACON_ID" in self.omitted:
+                yield "  Not every orphaned ID is listed; validate again after fixing these to see the rest."
+            yield ""
 
         if "WRONG_STATUS" in errors_by_type:
-            lines.append("WRONG_STATUS:")
-            lines.append("  These entries in confirmed_matches have invalid status values.")
-            lines.append("  - If status is 'rejected': move the entire object to 'rejected_matches' array")
-            lines.append("  - If status is 'pending' or 'skipped': remove from confirmed_matches entirely")
-            lines.append("  Valid statuses for confirmed_matches: confirmed, manual_match, manually_resolved")
-            lines.append("")
+            yield "WRONG_STATUS:"
+            yield "  These entries in confirmed_matches have invalid status values."
+            yield "  - If status is 'rejected': move the entire object to 'rejected_matches' array"
+            yield "  - If status is 'pending' or 'skipped': remove from confirmed_matches entirely"
+            yield "  Valid statuses for confirmed_matches: confirmed, manual_match, manually_resolved"
+            yield ""
 
         if "INCONSISTENT_MATCHED_FLAG" in errors_by_type:
-            lines.append("INCONSISTENT_MATCHED_FLAG:")
-            lines.append("  These beacon entries should have 'matched': true")
-            lines.append("  Find each beacon entry and change '\"matched\": false' to '\"matched\": true'")
-            lines.append("")
-
-        return "\n".join(lines)
+            yield "INCONSISTENT_MATCHED_FLAG:"
+            yield "  These beacon entries should have 'matched': true"
+            yield "  Find each beacon entry and change '\"matched\": false' to '\"matched\": true'"
+            yield ""
+
+    def generate_report_jsonl(self, fp, errors=None) -> int:
+        """Write one JSON object per validation error to a binary file object.
+
+        Each line has the keys type, message, location, suggestion and details.
+        Lines are written as they are encoded, so the whole report is never
+        held in memory. Writes `errors` (any iterable, e.g. iter_errors())
+        if given, otherwise self.errors. Returns the number of errors written.
+
+        Always encoded with the json module (compact, UTF-8), so the output is
+        the same whether or not orjson is installed.
+        """
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        count = 0
+        for error in self.errors if errors is None else errors:
+            count += 1
+            record = {
+                "type": error.error_type,
+                "message": error.message,
+                "location": error.location,
+                "suggestion": error.suggestion,
+                "details": error.details,
+            }
+            fp.write((encode(record) + "\n").encode("utf-8"))
+        return count
 
 
 def main():
-    # Determine file path
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
-    else:
-        file_path = "reconciliation_state.json"
+    parser = argparse.ArgumentParser(description="Validate a reconciliation state file.")
+    parser.add_argument("file_path", nargs="?", default="reconciliation_state.json",
+                        help="state file to validate (default: reconciliation_state.json)")
+    parser.add_argument("--format", choices=("text", "jsonl"), default="text",
+                        help="report format: text (default) or jsonl, one JSON object per error")
+    parser.add_argument("--max-errors-per-check", type=int, metavar="N",
+                        help="list at most N orphaned beacon IDs; the rest are only counted")
+    args = parser.parse_args()
+    if args.max_errors_per_check is not None and args.max_errors_per_check < 0:
+        parser.error("--max-errors-per-check must be 0 or more")
+    file_path = args.file_path
 
     print(f"Validating: {file_path}")
     print("")
 
     # Create validator and load file
-    validator = ReconciliationStateValidator(file_path)
+    validator = ReconciliationStateValidator(file_path, max_errors_per_check=args.max_errors_per_check)
 
     if not validator.load():
         sys.exit(1)
 
-    # Run validation
-    errors = validator.validate()
+    if args.format == "jsonl":
+        # Stream errors straight from the checks to the report file
+        report_path = Path("validation_report.jsonl")
+        with open(report_path, 'wb', buffering=_REPORT_BUFFER_SIZE) as f:
+            error_count = validator.generate_report_jsonl(f, validator.iter_errors())
+    else:
+        # Run validation
+        error_count = len(validator.validate())
 
-    # Generate and display report
-    report = validator.generate_report()
-    print(report)
+        # Generate and display report
+        report = validator.generate_report()
+        print(report)
 
-    # Save report to file
-    report_path = Path("validation_report.txt")
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(report)
+        # Save report to file
+        report_path = Path("validation_report.txt")
+        with open(report_path, 'w', encoding='utf-8', buffering=_REPORT_BUFFER_SIZE) as f:
+            f.write(report)
     print(f"Report saved to: {report_path.absolute()}")
 
     # Exit with appropriate code
-    if errors:
-        print(f"\nValidation FAILED with {len(errors)} error(s)")
+    omitted_count = sum(validator.omitted.values())
+    if omitted_count:
+        print(f"\nValidation FAILED with {error_count} error(s) listed and {omitted_count} more not listed")
+        sys.exit(1)
+    elif error_count:
+        print(f"\nValidation FAILED with {error_count} error(s)")
         sys.exit(1)
     else:
         print("\nValidation PASSED")